@@ -8,19 +8,26 @@ import asyncio
 import json
 import csv
 import socket
+import struct
 import os
 import ipaddress
 import signal
 import atexit
+import weakref
 from datetime import datetime, date, timedelta
-from collections import deque
-from typing import Dict, List, Set, Optional
+from collections import deque, defaultdict
+from typing import Dict, List, Optional
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 import logging
 
+try:
+    import orjson  # Optional: faster decoding of HBlink4 event frames
+except ImportError:
+    orjson = None
+
 try:
     from .user_db import UserDatabase, compute_next_refresh_seconds, _age_str
 except ImportError:
@@ -29,6 +36,9 @@ except ImportError:
     _sys.path.insert(0, str(Path(__file__).parent))
     from user_db import UserDatabase, compute_next_refresh_seconds, _age_str
 
+# Event frames are UTF-8 JSON; both decoders accept the raw bytes directly
+_decode_event = orjson.loads if orjson is not None else json.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -51,7 +61,8 @@ def load_config() -> dict:
             "port": 8765,
             "unix_socket": "/tmp/hblink4.sock",
             "ipv6": False,
-            "buffer_size": 65536
+            "buffer_size": 65536,
+            "framing": "length"
         },
         "user_database": {
             "enabled": True,
@@ -96,6 +107,10 @@ def load_config() -> dict:
 
 dashboard_config = load_config()
 
+# Events arriving within this window (seconds) go to WebSocket clients as one
+# 'batch' message - an active QSO produces a stream_update per slot every ~60ms
+EVENT_BATCH_WINDOW = 0.02
+
 # In-memory state (could be Redis/database for persistence)
 class DashboardState:
     """Maintains state for the dashboard"""
@@ -104,11 +119,15 @@ class DashboardState:
         self.repeater_details: Dict[int, dict] = {}  # Detailed info (sent once per connection)
         self.outbounds: Dict[str, dict] = {}  # Outbound connections (key: connection_name)
         self.openbridges: Dict[str, dict] = {}  # OpenBridge trunks (key: connection_name)
-        self.streams: Dict[str, dict] = {}  # key: f"{repeater_id}.{slot}" (OBP: f"{name}.{stream_id}")
+        self.streams: Dict[tuple, dict] = {}  # key: ('repeater', repeater_id, slot) / ('outbound', name, slot) / ('openbridge', name, stream_id)
         self.events: deque = deque(maxlen=500)  # Ring buffer of recent events
+        # Recent events indexed per repeater, so per-repeater queries don't scan the ring
+        self.events_by_repeater: Dict[int, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.streams_today_by_repeater: Dict[int, int] = defaultdict(int)  # RX stream starts since midnight
         self.last_heard: List[dict] = []  # Last heard users
         self.last_heard_stats: dict = {}  # User cache statistics
-        self.websocket_clients: Set[WebSocket] = set()
+        # Weak so a client whose endpoint has gone away never lingers here
+        self.websocket_clients: 'weakref.WeakSet[WebSocket]' = weakref.WeakSet()
         self.hblink_connected: bool = False  # Track HBlink4 connection status
         self.stats = {
             'total_calls_today': 0,      # Total RX calls (streams) received today
@@ -137,6 +156,7 @@ class DashboardState:
         self.stats['total_calls_today'] = 0
         self.stats['total_duration_today'] = 0.0
         self.stats['retransmitted_calls'] = 0
+        self.streams_today_by_repeater.clear()
         self.stats['last_reset_date'] = date.today().isoformat()
         logger.info(f"📊 Daily stats reset at midnight (server time)")
     
@@ -342,52 +362,97 @@ class DashboardState:
 state = DashboardState()
 
 
+async def _broadcast(payload: dict):
+    """Serialize payload once and send it to all WebSocket clients, dropping dead ones"""
+    if not state.websocket_clients:
+        return
+
+    # A client whose send failed is dropped here rather than waiting for its
+    # endpoint to notice: the endpoint holds it (and so keeps it in the
+    # WeakSet) until its receive loop exits
+    message = json.dumps(payload)
+    clients = list(state.websocket_clients)
+    results = await asyncio.gather(*(client.send_text(message) for client in clients),
+                                   return_exceptions=True)
+    for client, result in zip(clients, results):
+        if isinstance(result, BaseException):
+            logger.debug(f"Dropping WebSocket client after failed send: {result}")
+            state.websocket_clients.discard(client)
+
+
 async def broadcast_hblink_status(connected: bool):
     """Broadcast HBlink4 connection status to all WebSocket clients"""
     state.hblink_connected = connected
-    message = {
+    await _broadcast({
         'type': 'hblink_status',
         'data': {
             'connected': connected,
             'timestamp': datetime.now().isoformat()
         }
-    }
-    
-    # Broadcast to all connected clients
-    disconnected_clients = set()
-    for client in state.websocket_clients:
-        try:
-            await client.send_json(message)
-            
-            # If HBlink just connected, also send full current state to ensure browser has everything
-            if connected:
-                await client.send_json({
-                    'type': 'initial_state',
-                    'data': {
-                        'repeaters': list(state.repeaters.values()),
-                        'repeater_details': state.repeater_details,
-                        'outbounds': list(state.outbounds.values()),
-                        'openbridges': list(state.openbridges.values()),
-                        'streams': list(state.streams.values()),
-                        'events': list(state.events)[-50:],
-                        'stats': state.stats,
-                        'last_heard': state.last_heard,
-                        'hblink_connected': state.hblink_connected
-                    }
-                })
-        except Exception as e:
-            logger.debug(f"Failed to send status to client: {e}")
-            disconnected_clients.add(client)
+    })
+
+    # If HBlink just connected, also send full current state to ensure browser has everything
+    if connected:
+        await _broadcast({
+            'type': 'initial_state',
+            'data': {
+                'repeaters': list(state.repeaters.values()),
+                'repeater_details': state.repeater_details,
+                'outbounds': list(state.outbounds.values()),
+                'openbridges': list(state.openbridges.values()),
+                'streams': list(state.streams.values()),
+                'events': list(state.events)[-50:],
+                'stats': state.stats,
+                'last_heard': state.last_heard,
+                'hblink_connected': state.hblink_connected
+            }
+        })
+
+
+# Event frame header: payload length, 4 bytes big-endian
+_FRAME_HEADER = struct.Struct('>I')
+
+
+def encode_frame(payload: bytes, framing: str = 'length') -> bytes:
+    """Frame a message for the hblink4 event socket"""
+    if framing == 'jsonl':
+        return payload + b'\n'
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def split_frames(buffer: bytes, framing: str = 'length'):
+    """Split buffered socket data into (complete frames, leftover bytes)"""
+    if framing == 'jsonl':
+        *lines, rest = buffer.split(b'\n')
+        return [line for line in lines if line], rest
     
-    # Clean up disconnected clients
-    state.websocket_clients -= disconnected_clients
+    # Walk the buffer by offset and cut the leftover once at the end; hblink4
+    # sends events in batches, so re-slicing the tail per frame copied the
+    # rest of the batch over and over
+    frames = []
+    offset = 0
+    end = len(buffer)
+    while end - offset >= 4:
+        # Read length prefix (4 bytes, big-endian)
+        length, = _FRAME_HEADER.unpack_from(buffer, offset)
+        
+        # Check if we have complete frame
+        if end - offset - 4 < length:
+            break  # Wait for more data
+        
+        # Extract frame
+        offset += 4
+        frames.append(buffer[offset:offset + length])
+        offset += length
+    return frames, buffer[offset:]
 
 
 class TCPProtocol(asyncio.Protocol):
     """TCP protocol handler for receiving events from hblink4"""
     
-    def __init__(self, callback):
+    def __init__(self, callback, framing='length'):
         self.callback = callback
+        self.framing = framing
         self.buffer = b''
         self.transport = None
     
@@ -427,9 +492,7 @@ class TCPProtocol(asyncio.Protocol):
         # Send sync request to HBlink4 to trigger initial state send
         try:
             sync_request = json.dumps({'type': 'sync_request'}).encode('utf-8')
-            length = len(sync_request)
-            frame = length.to_bytes(4, byteorder='big') + sync_request
-            transport.write(frame)
+            transport.write(encode_frame(sync_request, self.framing))
             logger.info("📤 Sent sync_request to HBlink4")
         except Exception as e:
             logger.error(f"Failed to send sync_request: {e}")
@@ -439,22 +502,10 @@ class TCPProtocol(asyncio.Protocol):
     
     def data_received(self, data):
         """Called when TCP data received (handles framing)"""
-        self.buffer += data
+        frames, self.buffer = split_frames(self.buffer + data, self.framing)
         
         # Process all complete frames in buffer
-        while len(self.buffer) >= 4:
-            # Read length prefix (4 bytes, big-endian)
-            length = int.from_bytes(self.buffer[:4], byteorder='big')
-            
-            # Check if we have complete frame
-            if len(self.buffer) < 4 + length:
-                break  # Wait for more data
-            
-            # Extract frame
-            frame = self.buffer[4:4+length]
-            self.buffer = self.buffer[4+length:]
-            
-            # Process event
+        for frame in frames:
             asyncio.create_task(self.callback(frame))
     
     def connection_lost(self, exc):
@@ -474,8 +525,9 @@ class TCPProtocol(asyncio.Protocol):
 class UnixProtocol(asyncio.Protocol):
     """Unix socket protocol handler for receiving events from hblink4"""
     
-    def __init__(self, callback):
+    def __init__(self, callback, framing='length'):
         self.callback = callback
+        self.framing = framing
         self.buffer = b''
         self.transport = None
     
@@ -498,9 +550,7 @@ class UnixProtocol(asyncio.Protocol):
         # Send sync request to HBlink4 to trigger initial state send
         try:
             sync_request = json.dumps({'type': 'sync_request'}).encode('utf-8')
-            length = len(sync_request)
-            frame = length.to_bytes(4, byteorder='big') + sync_request
-            transport.write(frame)
+            transport.write(encode_frame(sync_request, self.framing))
             logger.info("📤 Sent sync_request to HBlink4")
         except Exception as e:
             logger.error(f"Failed to send sync_request: {e}")
@@ -510,22 +560,10 @@ class UnixProtocol(asyncio.Protocol):
     
     def data_received(self, data):
         """Called when data received (handles framing)"""
-        self.buffer += data
+        frames, self.buffer = split_frames(self.buffer + data, self.framing)
         
         # Process all complete frames in buffer
-        while len(self.buffer) >= 4:
-            # Read length prefix (4 bytes, big-endian)
-            length = int.from_bytes(self.buffer[:4], byteorder='big')
-            
-            # Check if we have complete frame
-            if len(self.buffer) < 4 + length:
-                break  # Wait for more data
-            
-            # Extract frame
-            frame = self.buffer[4:4+length]
-            self.buffer = self.buffer[4+length:]
-            
-            # Process event
+        for frame in frames:
             asyncio.create_task(self.callback(frame))
     
     def connection_lost(self, exc):
@@ -546,7 +584,8 @@ class EventReceiver:
     """Receives events from hblink4 via TCP or Unix socket"""
     
     def __init__(self, transport='unix', host_ipv4='127.0.0.1', host_ipv6='::1',
-                 port=8765, unix_socket='/tmp/hblink4.sock', disable_ipv6=False):
+                 port=8765, unix_socket='/tmp/hblink4.sock', disable_ipv6=False,
+                 framing='length'):
         """
         Initialize event receiver with transport abstraction
         
@@ -557,8 +596,10 @@ class EventReceiver:
             port: Listen port (for TCP)
             unix_socket: Unix socket path (for Unix transport)
             disable_ipv6: Disable IPv6 (for networks with broken IPv6)
+            framing: 'length' or 'jsonl'; must match hblink4's dashboard.framing
         """
         self.transport = transport.lower()
+        self.framing = framing.lower()
         self.host_ipv4 = host_ipv4
         self.host_ipv6 = host_ipv6 if not disable_ipv6 else None
         self.disable_ipv6 = disable_ipv6
@@ -568,6 +609,9 @@ class EventReceiver:
         self.port = port
         self.unix_socket = unix_socket
         self.server = None
+        # Events waiting for the next batched WebSocket flush
+        self._pending_events: List[dict] = []
+        self._flush_scheduled = False
         self.server_v6 = None
     
     async def start(self):
@@ -588,7 +632,7 @@ class EventReceiver:
         if self.host_ipv4:
             try:
                 self.server = await loop.create_server(
-                    lambda: TCPProtocol(self.process_event),
+                    lambda: TCPProtocol(self.process_event, self.framing),
                     self.host_ipv4, self.port,
                     family=socket.AF_INET
                 )
@@ -600,7 +644,7 @@ class EventReceiver:
         if self.host_ipv6:
             try:
                 self.server_v6 = await loop.create_server(
-                    lambda: TCPProtocol(self.process_event),
+                    lambda: TCPProtocol(self.process_event, self.framing),
                     self.host_ipv6, self.port,
                     family=socket.AF_INET6
                 )
@@ -619,7 +663,7 @@ class EventReceiver:
                 logger.warning(f"Failed to remove existing socket: {e}")
         
         self.server = await loop.create_unix_server(
-            lambda: UnixProtocol(self.process_event),
+            lambda: UnixProtocol(self.process_event, self.framing),
             self.unix_socket
         )
         
@@ -634,7 +678,7 @@ class EventReceiver:
     async def process_event(self, data: bytes):
         """Process incoming event from hblink4"""
         try:
-            event = json.loads(data.decode('utf-8'))
+            event = _decode_event(data)
             await self.handle_event(event)
         except Exception as e:
             logger.error(f"Error processing event: {e}")
@@ -646,6 +690,10 @@ class EventReceiver:
         
         # Update internal state based on event type
         if event_type == 'repeater_connected':
+            # Clean up IPv4-mapped IPv6 addresses once, at connect time
+            address = data.get('address')
+            if address and address.startswith('::ffff:'):
+                data['address'] = address[7:]
             state.repeaters[data['repeater_id']] = {
                 **data,
                 'connected_at': event['timestamp'],
@@ -663,6 +711,8 @@ class EventReceiver:
                 state.repeaters[data['repeater_id']]['last_activity'] = event['timestamp']
         
         elif event_type == 'repeater_disconnected':
+            state.events_by_repeater.pop(data['repeater_id'], None)
+            state.streams_today_by_repeater.pop(data['repeater_id'], None)
             if data['repeater_id'] in state.repeaters:
                 # Remove repeater from state immediately
                 del state.repeaters[data['repeater_id']]
@@ -690,18 +740,18 @@ class EventReceiver:
             connection_type = data.get('connection_type', 'repeater')
             
             if connection_type == 'openbridge':
-                # OBP is stream-multiplexed - key by connection_name.stream_id
-                key = f"{data['connection_name']}.{data.get('stream_id')}"
+                # OBP is stream-multiplexed - key by connection_name + stream_id
+                key = ('openbridge', data['connection_name'], data.get('stream_id'))
             elif connection_type == 'outbound':
-                # Outbound stream - key by connection_name.slot
-                key = f"{data['connection_name']}.{data['slot']}"
+                # Outbound stream - key by connection_name + slot
+                key = ('outbound', data['connection_name'], data['slot'])
             else:
                 repeater_id = data.get('repeater_id')
                 if repeater_id is None:
                     logger.error("Stream start missing repeater_id: %s", event)
                     return
-                # Repeater stream - key by repeater_id.slot (legacy behavior)
-                key = f"{repeater_id}.{data['slot']}"
+                # Repeater stream - key by repeater_id + slot
+                key = ('repeater', repeater_id, data['slot'])
             
             # Look up callsign from user database
             src_id = data.get('rf_src') or data.get('src_id')  # Handle both field names
@@ -795,11 +845,11 @@ class EventReceiver:
             # Handle both repeater and outbound streams
             connection_type = data.get('connection_type', 'repeater')
             if connection_type == 'openbridge':
-                key = f"{data['connection_name']}.{data.get('stream_id')}"
+                key = ('openbridge', data['connection_name'], data.get('stream_id'))
             elif connection_type == 'outbound':
-                key = f"{data['connection_name']}.{data['slot']}"
+                key = ('outbound', data['connection_name'], data['slot'])
             else:
-                key = f"{data['repeater_id']}.{data['slot']}"
+                key = ('repeater', data['repeater_id'], data['slot'])
 
             if key in state.streams:
                 state.streams[key]['packets'] = data['packets']
@@ -809,11 +859,11 @@ class EventReceiver:
             # Handle both repeater and outbound streams
             connection_type = data.get('connection_type', 'repeater')
             if connection_type == 'openbridge':
-                key = f"{data['connection_name']}.{data.get('stream_id')}"
+                key = ('openbridge', data['connection_name'], data.get('stream_id'))
             elif connection_type == 'outbound':
-                key = f"{data['connection_name']}.{data['slot']}"
+                key = ('outbound', data['connection_name'], data['slot'])
             else:
-                key = f"{data['repeater_id']}.{data['slot']}"
+                key = ('repeater', data['repeater_id'], data['slot'])
 
             if key in state.streams:
                 # Stream ended and entering hang time (combined event)
@@ -845,9 +895,9 @@ class EventReceiver:
             # Hang time has expired, clear the slot (handle both repeater and outbound)
             connection_type = data.get('connection_type', 'repeater')
             if connection_type == 'outbound':
-                key = f"{data['connection_name']}.{data['slot']}"
+                key = ('outbound', data['connection_name'], data['slot'])
             else:
-                key = f"{data['repeater_id']}.{data['slot']}"
+                key = ('repeater', data['repeater_id'], data['slot'])
                 
             if key in state.streams:
                 del state.streams[key]
@@ -929,30 +979,36 @@ class EventReceiver:
             # Only add RX streams to the events log (TX streams have is_assumed=True)
             if not data.get('is_assumed', False):
                 state.events.append(event)
+                if data.get('repeater_id') is not None:
+                    state.events_by_repeater[data['repeater_id']].append(event)
+                    if event_type == 'stream_start':
+                        state.streams_today_by_repeater[data['repeater_id']] += 1
         
         # For stream events, include updated last_heard list in the event
         if event_type in ['stream_start', 'stream_end', 'hang_time_expired']:
             event['last_heard'] = state.last_heard
         
-        # Send to all WebSocket clients
-        await self.send_to_clients(event)
+        # Queue for the next batched send to all WebSocket clients
+        self.queue_for_clients(event)
     
-    async def send_to_clients(self, event: dict):
-        """Send event to all connected WebSocket clients"""
+    def queue_for_clients(self, event: dict):
+        """Queue event for WebSocket clients, coalescing bursts into one send"""
         if not state.websocket_clients:
             return
-        
-        message = json.dumps(event)
-        disconnected = set()
-        
-        for client in state.websocket_clients:
-            try:
-                await client.send_text(message)
-            except:
-                disconnected.add(client)
-        
-        # Remove disconnected clients
-        state.websocket_clients -= disconnected
+        self._pending_events.append(event)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.create_task(self._flush_pending_events())
+    
+    async def _flush_pending_events(self):
+        """Send everything queued during the batch window as a single message"""
+        await asyncio.sleep(EVENT_BATCH_WINDOW)
+        batch, self._pending_events = self._pending_events, []
+        self._flush_scheduled = False
+        if len(batch) == 1:
+            await _broadcast(batch[0])
+        elif batch:
+            await _broadcast({'type': 'batch', 'events': batch})
 
 
 # REST API endpoints
@@ -1037,9 +1093,7 @@ async def get_repeater_details(repeater_id: int):
     uptime_seconds = int(current_time - repeater.get('connected_at', current_time))
     
     # Count streams for this repeater
-    total_streams = len([e for e in state.events 
-                        if e.get('type') == 'stream_start' 
-                        and e.get('data', {}).get('repeater_id') == repeater_id])
+    total_streams = state.streams_today_by_repeater.get(repeater_id, 0)
     
     # Find active streams
     slot1_active = any(s.get('repeater_id') == repeater_id and s.get('slot') == 1 
@@ -1049,18 +1103,13 @@ async def get_repeater_details(repeater_id: int):
                       and s.get('status') == 'active' 
                       for s in state.streams.values())
     
-    # Clean up IPv4-mapped IPv6 addresses
-    address = repeater.get('address', '')
-    if address.startswith('::ffff:'):
-        address = address[7:]  # Remove '::ffff:' prefix
-    
     # Build comprehensive response
     return {
         "repeater_id": repeater_id,
         "callsign": repeater.get('callsign', 'UNKNOWN'),
         "connection_type": repeater.get('connection_type', details.get('connection_type', 'unknown')),
         "connection": {
-            "address": address,
+            "address": repeater.get('address', ''),
             "connected_at": repeater.get('connected_at', 0),
             "uptime_seconds": uptime_seconds,
             "last_ping": repeater.get('last_ping', 0),
@@ -1149,14 +1198,19 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 # Serve frontend
+_dashboard_html: Optional[bytes] = None  # dashboard.html, read on first request
+
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard():
-    """Serve dashboard HTML"""
-    html_path = Path(__file__).parent / 'static' / 'dashboard.html'
-    if not html_path.exists():
-        return HTMLResponse("<h1>Dashboard HTML not found</h1><p>Please create dashboard/static/dashboard.html</p>", status_code=404)
-    with open(html_path) as f:
-        return HTMLResponse(f.read())
+    """Serve dashboard HTML (cached in memory - restart to pick up edits)"""
+    global _dashboard_html
+    if _dashboard_html is None:
+        html_path = Path(__file__).parent / 'static' / 'dashboard.html'
+        if not html_path.exists():
+            return HTMLResponse("<h1>Dashboard HTML not found</h1><p>Please create dashboard/static/dashboard.html</p>", status_code=404)
+        _dashboard_html = html_path.read_bytes()
+    return HTMLResponse(_dashboard_html, headers={"Cache-Control": "public, max-age=60"})
 
 
 # Mount static files
@@ -1175,7 +1229,8 @@ async def startup_event():
         host_ipv6=receiver_config.get('host_ipv6', '::1'),
         port=receiver_config.get('port', 8765),
         unix_socket=receiver_config.get('unix_socket', '/tmp/hblink4.sock'),
-        disable_ipv6=receiver_config.get('disable_ipv6', False)
+        disable_ipv6=receiver_config.get('disable_ipv6', False),
+        framing=receiver_config.get('framing', 'length')
     )
     asyncio.create_task(receiver.start())
     asyncio.create_task(midnight_reset_task())
@@ -1203,18 +1258,26 @@ async def shutdown_event():
     logger.info("✅ Dashboard shutdown complete")
 
 
+def seconds_until_midnight(now: Optional[datetime] = None) -> float:
+    """Seconds from `now` (local server time) until the next local midnight."""
+    now = now or datetime.now()
+    next_midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (next_midnight - now).total_seconds()
+
+
 async def midnight_reset_task():
     """Background task to reset daily stats at midnight"""
     while True:
-        # Check if date has changed
+        # Check if date has changed (also catches stale stats at startup)
         current_date = date.today().isoformat()
         if current_date != state.stats.get('last_reset_date'):
             state.reset_daily_stats()
             # Send stats update to all WebSocket clients
             await send_stats_update()
 
-        # Check every 60 seconds
-        await asyncio.sleep(60)
+        # Sleep until just past midnight instead of polling every minute. Capped
+        # at an hour so DST shifts or wall-clock jumps can't delay the reset.
+        await asyncio.sleep(min(seconds_until_midnight() + 1, 3600))
 
 
 async def user_db_refresh_task():
@@ -1279,40 +1342,20 @@ async def broadcast_user_db_status(trigger: str, status: str):
     payload = state.user_db.status_dict()
     payload["trigger"] = trigger
     payload["status"] = status
-    message = json.dumps({
+    await _broadcast({
         "type": "user_db_status",
         "timestamp": datetime.now().timestamp(),
         "data": payload,
     })
-    disconnected = set()
-    for client in state.websocket_clients:
-        try:
-            await client.send_text(message)
-        except Exception:
-            disconnected.add(client)
-    state.websocket_clients -= disconnected
 
 
 async def send_stats_update():
     """Send stats update to all WebSocket clients"""
-    if not state.websocket_clients:
-        return
-    
-    message = json.dumps({
+    await _broadcast({
         'type': 'stats_reset',
         'timestamp': datetime.now().timestamp(),
         'data': state.stats
     })
-    
-    disconnected = set()
-    for client in state.websocket_clients:
-        try:
-            await client.send_text(message)
-        except:
-            disconnected.add(client)
-    
-    # Remove disconnected clients
-    state.websocket_clients -= disconnected
 
 
 # ========== GRACEFUL SHUTDOWN HANDLING ==========
@@ -1349,6 +1392,24 @@ if __name__ == "__main__":
 atexit.register(save_persistent_data)  # Fallback for emergency exit
 
 
+def select_event_loop() -> str:
+    """
+    Pick the uvicorn event loop implementation.
+
+    uvloop (shipped with uvicorn[standard]) cuts the per-await cost of the
+    WebSocket fan-out, but it has broken the Unix socket event receiver in the
+    past, so it is only used for the TCP transport and only when installed.
+    """
+    transport = dashboard_config.get('event_receiver', {}).get('transport', 'unix')
+    if transport != 'tcp':
+        return "asyncio"
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return "asyncio"
+    return "uvloop"
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -1356,5 +1417,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8080,
         log_level="info",
-        access_log=False  # Disable access logging (reduces log clutter)
+        access_log=False,  # Disable access logging (reduces log clutter)
+        loop=select_event_loop(),
+        http="auto",  # httptools when available, h11 otherwise
+        ws="websockets"
     )
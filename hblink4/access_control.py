@@ -2,13 +2,46 @@
 Access control and configuration matching module for HBlink4
 """
 
+import heapq
 import re
-from typing import Optional, Dict, Any, List, Tuple, Union, Literal
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Optional, Dict, Any, List, Tuple, Union, Literal, FrozenSet, Pattern
 from dataclasses import dataclass, field
 
+try:
+    from .utils import DATACLASS_SLOTS
+except ImportError:
+    # Fallback for when called from outside package
+    from utils import DATACLASS_SLOTS
+
+__all__ = [
+    'InvalidPatternError',
+    'BlacklistError',
+    'validate_pattern',
+    'build_range_index',
+    'in_range_index',
+    'CallsignMatcher',
+    'fold_callsign',
+    'BlacklistMatch',
+    'RepeaterConfig',
+    'PatternMatch',
+    'PatternIndex',
+    'RepeaterMatcher',
+]
+
 MatchType = Literal['specific_id', 'id_range', 'callsign']
 PatternValue = Union[List[int], List[Tuple[int, int]], List[str]]
 
+# Upper bound on memoized (radio_id, callsign) lookups per RepeaterMatcher
+LOOKUP_CACHE_SIZE = 4096
+
+# Slots in PatternIndex's ID prefilter (IDs are folded modulo this size)
+ID_FILTER_SIZE = 1 << 16
+
+_CALLSIGN_LIST_RE = re.compile(r'[A-Za-z0-9*]+(?:,[A-Za-z0-9*]+)*')
+
 class InvalidPatternError(Exception):
     """Raised when a pattern configuration is invalid"""
 
@@ -18,7 +51,10 @@ def validate_pattern(match_type: Literal['specific_id', 'id_range', 'callsign'],
         raise InvalidPatternError(f"{match_type} pattern must be a list")
 
     if match_type == 'specific_id':
-        if not all(isinstance(x, int) for x in pattern):
+        # array() type-checks every element in C (floats/strings raise TypeError)
+        try:
+            array('q', pattern)
+        except (TypeError, OverflowError):
             raise InvalidPatternError("Specific ID patterns must contain only integers")
             
     elif match_type == 'id_range':
@@ -29,9 +65,85 @@ def validate_pattern(match_type: Literal['specific_id', 'id_range', 'callsign'],
                 raise InvalidPatternError(f"Invalid range: start ({start}) > end ({end})")
             
     else:  # callsign
-        if not all(isinstance(p, str) and re.match(r'^[A-Za-z0-9*]+$', p) for p in pattern):
+        # One regex pass over the joined list instead of one re.match per entry;
+        # the separator count guards against an entry smuggling in its own ','
+        try:
+            joined = ','.join(pattern)
+        except TypeError:
+            joined = None
+        if pattern and (joined is None or joined.count(',') != len(pattern) - 1
+                        or not _CALLSIGN_LIST_RE.fullmatch(joined)):
             raise InvalidPatternError("Callsign patterns must contain only alphanumeric characters and *")
 
+def build_range_index(id_ranges: List[Tuple[int, int]]) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Merge ID ranges into sorted, non-overlapping (starts, ends) tuples so a
+    lookup is a single bisect instead of a scan over every range
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    for start, end in sorted(id_ranges):
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return tuple(starts), tuple(ends)
+
+def in_range_index(radio_id: int, starts: Tuple[int, ...], ends: Tuple[int, ...]) -> bool:
+    """Check whether radio_id falls inside a range index built by build_range_index"""
+    i = bisect_right(starts, radio_id) - 1
+    return i >= 0 and radio_id <= ends[i]
+
+class CallsignMatcher:
+    """
+    Matches a callsign against a list of '*' globs (case-insensitive).
+    Globs are classified once so the common shapes - exact, 'PREFIX*',
+    '*SUFFIX' and '*PART*' - are plain string operations; anything else
+    falls back to a single precompiled regex.
+    """
+    __slots__ = ('exact', 'prefixes', 'suffixes', 'contains', 'regex', 'has_globs')
+
+    def __init__(self, callsigns: List[str]):
+        exact, prefixes, suffixes, contains, other = set(), [], [], [], []
+        for glob in callsigns:
+            glob = glob.upper()
+            stars = glob.count('*')
+            if stars == 0:
+                exact.add(glob)
+            elif stars == 1 and glob.endswith('*'):
+                prefixes.append(glob[:-1])
+            elif stars == 1 and glob.startswith('*'):
+                suffixes.append(glob[1:])
+            elif stars == 2 and glob.startswith('*') and glob.endswith('*'):
+                contains.append(glob[1:-1])
+            else:
+                other.append('.*'.join(re.escape(chunk) for chunk in glob.split('*')))
+        self.exact: FrozenSet[str] = frozenset(exact)
+        self.prefixes: Tuple[str, ...] = tuple(prefixes)
+        self.suffixes: Tuple[str, ...] = tuple(suffixes)
+        self.contains: Tuple[str, ...] = tuple(contains)
+        # Globs are upper-cased above and input is folded before matching,
+        # so the regex needs no IGNORECASE
+        self.regex: Optional[Pattern] = re.compile(f"(?:{'|'.join(other)})\\Z") if other else None
+        self.has_globs = bool(prefixes or suffixes or contains or other)
+
+    def match(self, callsign: str) -> bool:
+        """Return True if callsign matches any of the globs"""
+        return self.match_upper(callsign.upper())
+
+    def match_upper(self, cs: str) -> bool:
+        """match() for a callsign that is already upper-case"""
+        return (cs in self.exact
+                or cs.startswith(self.prefixes)
+                or cs.endswith(self.suffixes)
+                or any(part in cs for part in self.contains)
+                or (self.regex is not None and self.regex.match(cs) is not None))
+
+def fold_callsign(callsign: Optional[str]) -> Optional[str]:
+    """Upper-case and intern a callsign once, before it is matched or used as a key"""
+    return sys.intern(callsign.upper()) if callsign else callsign
+
 class BlacklistError(Exception):
     """Raised when a repeater matches a blacklist pattern"""
     def __init__(self, pattern_name: str, reason: str):
@@ -39,7 +151,7 @@ class BlacklistError(Exception):
         self.reason = reason
         super().__init__(f"Repeater blocked by {pattern_name}: {reason}")
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BlacklistMatch:
     """Represents a blacklist pattern"""
     name: str
@@ -48,6 +160,11 @@ class BlacklistMatch:
     id_ranges: List[Tuple[int, int]] = field(default_factory=list)
     callsigns: List[str] = field(default_factory=list)
     reason: str = ''
+    # Lookup structure built from the lists above (not part of the config)
+    _id_set: FrozenSet[int] = field(init=False, repr=False, compare=False, default=frozenset())
+    _range_starts: Tuple[int, ...] = field(init=False, repr=False, compare=False, default=())
+    _range_ends: Tuple[int, ...] = field(init=False, repr=False, compare=False, default=())
+    _callsign_matcher: Optional[CallsignMatcher] = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self):
         """Validate all patterns"""
@@ -57,8 +174,11 @@ class BlacklistMatch:
             validate_pattern('id_range', self.id_ranges)
         if self.callsigns:
             validate_pattern('callsign', self.callsigns)
+        self._id_set = frozenset(self.ids)
+        self._range_starts, self._range_ends = build_range_index(self.id_ranges)
+        self._callsign_matcher = CallsignMatcher(self.callsigns) if self.callsigns else None
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RepeaterConfig:
     """Configuration settings for a matched repeater"""
     passphrase: str
@@ -70,7 +190,7 @@ class RepeaterConfig:
     # override via UNIT=true|false in RPTO. Absent UNIT in RPTO = use this.
     default_unit_calls: bool = False
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PatternMatch:
     """Represents a pattern matching rule for repeater configuration"""
     name: str
@@ -80,6 +200,11 @@ class PatternMatch:
     ids: List[int] = field(default_factory=list)
     id_ranges: List[Tuple[int, int]] = field(default_factory=list)
     callsigns: List[str] = field(default_factory=list)
+    # Lookup structure built from the lists above (not part of the config)
+    _id_set: FrozenSet[int] = field(init=False, repr=False, compare=False, default=frozenset())
+    _range_starts: Tuple[int, ...] = field(init=False, repr=False, compare=False, default=())
+    _range_ends: Tuple[int, ...] = field(init=False, repr=False, compare=False, default=())
+    _callsign_matcher: Optional[CallsignMatcher] = field(init=False, repr=False, compare=False, default=None)
 
     def __post_init__(self):
         """Validate all patterns"""
@@ -93,6 +218,117 @@ class PatternMatch:
         # At least one match type must be specified
         if not (self.ids or self.id_ranges or self.callsigns):
             raise InvalidPatternError(f"Pattern '{self.name}' must specify at least one match type")
+        self._id_set = frozenset(self.ids)
+        self._range_starts, self._range_ends = build_range_index(self.id_ranges)
+        self._callsign_matcher = CallsignMatcher(self.callsigns) if self.callsigns else None
+
+class PatternIndex:
+    """
+    First-match lookup across an ordered list of patterns. IDs, ranges and
+    callsigns from every pattern are folded into shared structures, so a
+    lookup is one dict probe and one bisect however many patterns exist;
+    only callsign globs are checked per pattern, and only for patterns
+    ahead of the best ID/range hit.
+    """
+    def __init__(self, patterns: List[Union['BlacklistMatch', 'PatternMatch']]):
+        self.patterns = patterns
+
+        # radio_id -> index of the first pattern listing it
+        self._id_first: Dict[int, int] = {}
+        for i in reversed(range(len(patterns))):
+            for rid in patterns[i]._id_set:
+                self._id_first[rid] = i
+
+        # Split the ID space at every range boundary; each resulting segment
+        # records the first pattern whose ranges cover it. Built with one sweep
+        # over the sorted boundaries (a heap tracks the covering patterns), so
+        # shared ban lists with tens of thousands of ranges still load quickly.
+        opens: Dict[int, List[int]] = {}
+        closes: Dict[int, List[int]] = {}
+        for i, p in enumerate(patterns):
+            for start, end in zip(p._range_starts, p._range_ends):
+                opens.setdefault(start, []).append(i)
+                closes.setdefault(end + 1, []).append(i)
+        bounds = sorted(opens.keys() | closes.keys())
+        covering: List[int] = []  # heap of pattern indexes (lazy deletion)
+        open_count: Dict[int, int] = {}
+        seg_starts: List[int] = []
+        seg_ends: List[int] = []
+        seg_first: List[int] = []
+        for lo, next_lo in zip(bounds, bounds[1:]):
+            for i in closes.get(lo, ()):
+                open_count[i] -= 1
+            for i in opens.get(lo, ()):
+                open_count[i] = open_count.get(i, 0) + 1
+                heapq.heappush(covering, i)
+            while covering and not open_count[covering[0]]:
+                heapq.heappop(covering)
+            if not covering:
+                continue
+            first = covering[0]
+            if seg_first and seg_first[-1] == first and seg_ends[-1] + 1 == lo:
+                seg_ends[-1] = next_lo - 1
+            else:
+                seg_starts.append(lo)
+                seg_ends.append(next_lo - 1)
+                seg_first.append(first)
+        self._seg_starts = tuple(seg_starts)
+        self._seg_ends = tuple(seg_ends)
+        self._seg_first = tuple(seg_first)
+
+        # Prefilter on the low 16 bits of the ID: a clear flag proves no ID or
+        # range can match, which is the usual answer for the blacklist
+        self._id_filter = bytearray(ID_FILTER_SIZE)
+        for rid in self._id_first:
+            self._id_filter[rid % ID_FILTER_SIZE] = 1
+        for start, end in zip(self._seg_starts, self._seg_ends):
+            if end - start + 1 >= ID_FILTER_SIZE:
+                self._id_filter[:] = b'\x01' * ID_FILTER_SIZE
+                break
+            lo, hi = start % ID_FILTER_SIZE, end % ID_FILTER_SIZE
+            if lo <= hi:
+                self._id_filter[lo:hi + 1] = b'\x01' * (hi - lo + 1)
+            else:  # range wraps around the filter
+                self._id_filter[lo:] = b'\x01' * (ID_FILTER_SIZE - lo)
+                self._id_filter[:hi + 1] = b'\x01' * (hi + 1)
+
+        # Literal callsigns from every pattern share one dict (first pattern
+        # wins); only patterns with real globs are matched one by one
+        self._exact_first: Dict[str, int] = {}
+        for i in reversed(range(len(patterns))):
+            matcher = patterns[i]._callsign_matcher
+            if matcher is not None:
+                for cs in matcher.exact:
+                    self._exact_first[cs] = i
+        self._callsign_matchers = tuple((i, p._callsign_matcher) for i, p in enumerate(patterns)
+                                        if p._callsign_matcher is not None
+                                        and p._callsign_matcher.has_globs)
+        self._has_callsigns = bool(self._exact_first or self._callsign_matchers)
+
+    def first_match(self, radio_id: int, callsign: Optional[str] = None) -> Optional[int]:
+        """
+        Return the index of the first pattern matching radio_id or callsign,
+        or None. callsign must already be upper-case (see fold_callsign).
+        """
+        best = len(self.patterns)
+
+        if self._id_filter[radio_id % ID_FILTER_SIZE]:
+            best = self._id_first.get(radio_id, best)
+            i = bisect_right(self._seg_starts, radio_id) - 1
+            if i >= 0 and radio_id <= self._seg_ends[i] and self._seg_first[i] < best:
+                best = self._seg_first[i]
+
+        if callsign and self._has_callsigns:
+            if self._exact_first:
+                best = min(best, self._exact_first.get(callsign, best))
+            for i, matcher in self._callsign_matchers:
+                if i >= best:
+                    break
+                if matcher.match_upper(callsign):
+                    best = i
+                    break
+
+        return best if best < len(self.patterns) else None
 
 class RepeaterMatcher:
     """
@@ -102,6 +338,11 @@ class RepeaterMatcher:
         self.blacklist = self._parse_blacklist(config.get('blacklist', {"patterns": []}))
         repeater_config = config.get('repeater_configurations', config.get('repeaters', {}))
         self.patterns = self._parse_patterns(repeater_config.get('patterns', []))
+        self._blacklist_index = PatternIndex(self.blacklist)
+        self._blacklist_empty = not self.blacklist  # the common case - skip the check entirely
+        self._pattern_index = PatternIndex(self.patterns)
+        # (radio_id, callsign) -> (blacklist match, pattern match); see _lookup
+        self._lookup_cache: Dict[Tuple[int, Optional[str]], Tuple[Optional[BlacklistMatch], Optional[PatternMatch]]] = {}
         
         # Make default config optional - only use if explicitly provided
         if 'default' in repeater_config:
@@ -109,24 +350,30 @@ class RepeaterMatcher:
         else:
             self.default_config = None
 
+    @staticmethod
+    def _extract_match_types(match_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Pull the match types (can be multiple) out of a pattern's 'match'
+        section in one pass; absent types take the dataclass defaults
+        """
+        match_types: Dict[str, Any] = {}
+        if 'ids' in match_dict:
+            match_types['ids'] = match_dict['ids']
+        if 'id_ranges' in match_dict:
+            match_types['id_ranges'] = [tuple(r) for r in match_dict['id_ranges']]
+        if 'callsigns' in match_dict:
+            match_types['callsigns'] = match_dict['callsigns']
+        return match_types
+
     def _parse_blacklist(self, blacklist_config: Dict[str, Any]) -> List[BlacklistMatch]:
         """Parse blacklist patterns from config - supports multiple match types per pattern"""
         result = []
         for pattern in blacklist_config['patterns']:
-            match_dict = pattern['match']
-            
-            # Extract all match types (can be multiple)
-            ids = match_dict.get('ids', [])
-            id_ranges = [tuple(r) for r in match_dict.get('id_ranges', [])]
-            callsigns = match_dict.get('callsigns', [])
-            
             result.append(BlacklistMatch(
                 name=pattern['name'],
                 description=pattern['description'],
-                ids=ids,
-                id_ranges=id_ranges,
-                callsigns=callsigns,
-                reason=pattern['reason']
+                reason=pattern['reason'],
+                **self._extract_match_types(pattern['match'])
             ))
         return result
 
@@ -134,50 +381,48 @@ class RepeaterMatcher:
         """Parse pattern configurations from config file - supports multiple match types per pattern"""
         result = []
         for pattern in patterns:
-            match_dict = pattern['match']
             config = RepeaterConfig(**pattern['config'])
             
-            # Extract all match types (can be multiple)
-            ids = match_dict.get('ids', [])
-            id_ranges = [tuple(r) for r in match_dict.get('id_ranges', [])]
-            callsigns = match_dict.get('callsigns', [])
-            
             result.append(PatternMatch(
                 name=pattern['name'],
                 description=pattern.get('description', ''),
                 config=config,
-                ids=ids,
-                id_ranges=id_ranges,
-                callsigns=callsigns
+                **self._extract_match_types(pattern['match'])
             ))
         
         # No need to sort - patterns are evaluated in order, first match wins
         return result
 
-    def _match_pattern(self, radio_id: int, callsign: Optional[str], pattern: Union[BlacklistMatch, PatternMatch]) -> bool:
-        """Match a repeater against a pattern - checks all match types with OR logic"""
-        # Check specific IDs
-        if pattern.ids and radio_id in pattern.ids:
-            return True
-        
-        # Check ID ranges
-        if pattern.id_ranges and any(start <= radio_id <= end for start, end in pattern.id_ranges):
-            return True
-        
-        # Check callsign patterns
-        if pattern.callsigns and callsign:
-            for p in pattern.callsigns:
-                pattern_regex = p.replace('*', '.*') if '*' in p else re.escape(p)
-                if re.match(f"^{pattern_regex}$", callsign, re.IGNORECASE):
-                    return True
-        
-        return False
+    def _lookup(self, radio_id: int, callsign: Optional[str]) -> Optional[PatternMatch]:
+        """
+        Return the first matching pattern (None = default), memoized per
+        (radio_id, callsign) since the same repeaters re-login and re-send
+        config over and over.
+
+        Raises:
+            BlacklistError: If the repeater matches any blacklist pattern
+        """
+        callsign = fold_callsign(callsign)
+        key = (radio_id, callsign)
+        hit = self._lookup_cache.get(key)
+        if hit is None:
+            b = None if self._blacklist_empty else self._blacklist_index.first_match(radio_id, callsign)
+            p = self._pattern_index.first_match(radio_id, callsign)
+            hit = (self.blacklist[b] if b is not None else None,
+                   self.patterns[p] if p is not None else None)
+            if len(self._lookup_cache) >= LOOKUP_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._lookup_cache[next(iter(self._lookup_cache))]
+            self._lookup_cache[key] = hit
+
+        blocked, pattern = hit
+        if blocked is not None:
+            raise BlacklistError(blocked.name, blocked.reason)
+        return pattern
 
-    def _check_blacklist(self, radio_id: int, callsign: Optional[str] = None) -> None:
-        """Check if a repeater matches any blacklist patterns"""
-        for pattern in self.blacklist:
-            if self._match_pattern(radio_id, callsign, pattern):
-                raise BlacklistError(pattern.name, pattern.reason)
+    def invalidate_cache(self) -> None:
+        """Drop memoized lookups - call after changing blacklist or patterns"""
+        self._lookup_cache.clear()
 
     def get_repeater_config(self, radio_id: int, callsign: Optional[str] = None) -> Optional[RepeaterConfig]:
         """
@@ -192,13 +437,10 @@ class RepeaterMatcher:
         Raises:
             BlacklistError: If the repeater matches any blacklist pattern
         """
-        # Check blacklist first
-        self._check_blacklist(radio_id, callsign)
-        
-        # Patterns are already sorted by specificity in _parse_patterns
-        for pattern in self.patterns:
-            if self._match_pattern(radio_id, callsign, pattern):
-                return pattern.config
+        # Blacklist is checked first, then patterns in config order (first match wins)
+        pattern = self._lookup(radio_id, callsign)
+        if pattern is not None:
+            return pattern.config
 
         # If no patterns match, return default configuration (or None if not defined)
         return self.default_config
@@ -211,13 +453,5 @@ class RepeaterMatcher:
         Raises:
             BlacklistError: If the repeater matches any blacklist pattern
         """
-        # Check blacklist first
-        self._check_blacklist(radio_id, callsign)
-        
-        # Find the matching pattern
-        for pattern in self.patterns:
-            if self._match_pattern(radio_id, callsign, pattern):
-                return pattern
-        
-        # No pattern matched, using default
-        return None
+        # Blacklist is checked first; None = no pattern matched, using default
+        return self._lookup(radio_id, callsign)
@@ -7,8 +7,14 @@ specific sections like outbound connections.
 import json
 import logging
 import sys
+from dataclasses import fields
 from typing import List, Dict, Any
 
+try:
+    import orjson  # Optional: faster JSON parsing for large configs
+except ImportError:
+    orjson = None
+
 # Import connection config models
 try:
     from .models import OutboundConnectionConfig, OpenBridgeConnectionConfig
@@ -35,11 +41,12 @@ def load_config(config_file: str, logger: logging.Logger = None) -> Dict[str, An
         SystemExit: If configuration cannot be loaded
     """
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-            if logger:
-                logger.info(f'✓ Configuration loaded from {config_file}')
-            return config
+        with open(config_file, 'rb') as f:
+            raw = f.read()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if logger:
+            logger.info(f'✓ Configuration loaded from {config_file}')
+        return config
     except Exception as e:
         if logger:
             logger.error(f'✗ Error loading configuration from {config_file}: {e}')
@@ -48,6 +55,11 @@ def load_config(config_file: str, logger: logging.Logger = None) -> Dict[str, An
         sys.exit(1)
 
 
+# Config keys accepted for an outbound connection (the dataclass fields)
+_OUTBOUND_FIELDS = frozenset(f.name for f in fields(OutboundConnectionConfig))
+_OUTBOUND_REQUIRED = ('name', 'address', 'port', 'radio_id')
+
+
 def parse_outbound_connections(config: Dict[str, Any], logger: logging.Logger = None) -> List:
     """
     Parse outbound connections from configuration dictionary.
@@ -62,8 +74,6 @@ def parse_outbound_connections(config: Dict[str, Any], logger: logging.Logger =
     Raises:
         SystemExit: If required configuration fields are missing or invalid
     """
-    # OutboundConnectionConfig is now imported at module level
-    
     outbound_configs = []
     
     raw_outbounds = config.get('outbound_connections', [])
@@ -74,28 +84,15 @@ def parse_outbound_connections(config: Dict[str, Any], logger: logging.Logger =
     
     for idx, conn_dict in enumerate(raw_outbounds):
         try:
-            config_obj = OutboundConnectionConfig(
-                enabled=conn_dict.get('enabled', True),
-                name=conn_dict['name'],
-                address=conn_dict['address'],
-                port=conn_dict['port'],
-                radio_id=conn_dict['radio_id'],
-                passphrase=conn_dict.get('passphrase', conn_dict.get('password', '')),  # Support both keys for backward compatibility
-                options=conn_dict.get('options', ''),
-                callsign=conn_dict.get('callsign', ''),
-                rx_frequency=conn_dict.get('rx_frequency', 0),
-                tx_frequency=conn_dict.get('tx_frequency', 0),
-                power=conn_dict.get('power', 0),
-                colorcode=conn_dict.get('colorcode', 1),
-                latitude=conn_dict.get('latitude', 0.0),
-                longitude=conn_dict.get('longitude', 0.0),
-                height=conn_dict.get('height', 0),
-                location=conn_dict.get('location', ''),
-                description=conn_dict.get('description', ''),
-                url=conn_dict.get('url', ''),
-                software_id=conn_dict.get('software_id', 'HBlink4'),
-                package_id=conn_dict.get('package_id', 'HBlink4 v2.0')
-            )
+            for key in _OUTBOUND_REQUIRED:
+                if key not in conn_dict:
+                    raise KeyError(key)
+            # Pass known keys straight through; anything absent takes the dataclass default
+            kwargs = {k: v for k, v in conn_dict.items() if k in _OUTBOUND_FIELDS}
+            kwargs.setdefault('enabled', True)
+            if 'passphrase' not in kwargs:
+                kwargs['passphrase'] = conn_dict.get('password', '')  # Backward-compatible key
+            config_obj = OutboundConnectionConfig(**kwargs)
             outbound_configs.append(config_obj)
             if logger:
                 logger.info(f'✓ Loaded outbound connection: {config_obj.name} → {config_obj.address}:{config_obj.port}')
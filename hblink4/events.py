@@ -5,16 +5,66 @@ Supports TCP (remote) and Unix socket (local)
 Performance: TCP ~5-15μs, Unix socket ~0.5-1μs
 Dashboard connection state tracked for both transports
 """
+import asyncio
+import errno
 import socket
+import struct
 import json
 import logging
 import os
 import ipaddress
 from time import time
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
+
+try:
+    import orjson  # Optional: faster JSON encoding for dashboard events
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Events are coalesced into one send per flush: queued frames go out after
+# EVENT_FLUSH_DELAY seconds, or immediately once EVENT_FLUSH_BYTES are waiting
+EVENT_FLUSH_DELAY = 0.001
+EVENT_FLUSH_BYTES = 4096
+# Unsent bytes we hold while the dashboard isn't keeping up; new events are
+# dropped beyond this (whole frames only, so the stream never desyncs)
+EVENT_BACKLOG_LIMIT = 1 << 20
+
+# Consecutive failed connects before the TCP emitter tries the other address
+# family (when both host_ipv6 and host_ipv4 are configured). Only errors that
+# say the host can't be reached over this family count; a refused connect
+# means the family works and the dashboard just isn't listening
+TCP_FAMILY_SWITCH_FAILURES = 3
+_UNREACHABLE_ERRNOS = frozenset((errno.ENETUNREACH, errno.EHOSTUNREACH,
+                                 errno.EADDRNOTAVAIL, errno.ETIMEDOUT))
+
+# Frame header: payload length, 4 bytes big-endian
+_FRAME_HEADER = struct.Struct('>I')
+
+# Create sockets non-blocking and close-on-exec in the socket() call where the
+# platform allows it (Linux), saving the separate setblocking() syscall and
+# leaving no window where a forked child could inherit the descriptor
+_SOCK_NONBLOCK = getattr(socket, 'SOCK_NONBLOCK', 0)
+_SOCK_CLOEXEC = getattr(socket, 'SOCK_CLOEXEC', 0)
+
+
+def _nonblocking_stream_socket(family):
+    sock = socket.socket(family, socket.SOCK_STREAM | _SOCK_NONBLOCK | _SOCK_CLOEXEC)
+    if not _SOCK_NONBLOCK:
+        sock.setblocking(False)
+    return sock
+
+
+# Event encoder: returns compact UTF-8 JSON bytes either way. OPT_NON_STR_KEYS
+# keeps orjson's output compatible with json.dumps for dicts keyed by ints.
+if orjson is not None:
+    def _encode_event(obj: Dict[str, Any]) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def _encode_event(obj: Dict[str, Any]) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 
 # Tune TCP keepalive so a silently-severed connection (NIC/interface flap, DHCP
 # renew, firewall/conntrack eviction, router reboot -- anything that drops the
@@ -33,6 +83,26 @@ def _tune_tcp_keepalive(sock):
         logger.debug(f"Could not tune TCP keepalive: {e}")
 
 
+# Bound how much unsent data the kernel queues for us instead of pinning
+# SO_SNDBUF: a fixed SO_SNDBUF turns off send buffer autotuning, while
+# TCP_NOTSENT_LOWAT keeps queued events (and their latency) small and leaves
+# the buffer size to the kernel. Skipped where Python doesn't expose the
+# option; harmless if the platform rejects it.
+TCP_NOTSENT_LOWAT_BYTES = 16384
+
+def _limit_tcp_unsent(sock):
+    if not hasattr(socket, 'TCP_NOTSENT_LOWAT'):
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT, TCP_NOTSENT_LOWAT_BYTES)
+    except OSError as e:
+        logger.debug(f"Could not set TCP_NOTSENT_LOWAT: {e}")
+
+
+def _emit_disabled(event_type: str, data: Dict[str, Any]) -> None:
+    """emit() for a disabled emitter"""
+
+
 class EventEmitter:
     """
     Event emitter with pluggable transport layer.
@@ -44,19 +114,22 @@ class EventEmitter:
                  port: int = 8765,
                  unix_socket: str = '/tmp/hblink4.sock',
                  disable_ipv6: bool = False,
-                 buffer_size: int = 65536):
+                 buffer_size: int = 65536,
+                 framing: str = 'length'):
         """
         Initialize event emitter with transport abstraction
         
         Args:
-            enabled: Whether to emit events (False = zero overhead)
+            enabled: Whether to emit events (False = emit() is a no-op)
             transport: 'tcp' or 'unix'
             host_ipv4: Dashboard host IPv4 address (for TCP)
             host_ipv6: Dashboard host IPv6 address (for TCP)
             port: Dashboard port (for TCP)
             unix_socket: Unix socket path (for Unix transport)
             disable_ipv6: Disable IPv6 (for networks with broken IPv6)
-            buffer_size: Socket send buffer size
+            buffer_size: Socket send buffer size (Unix transport; TCP is autotuned)
+            framing: 'length' (4-byte length prefix) or 'jsonl' (newline
+                after each message); must match the dashboard's setting
         """
         self.enabled = enabled
         self.transport = transport.lower()
@@ -66,41 +139,60 @@ class EventEmitter:
         self.unix_socket = unix_socket
         self.disable_ipv6 = disable_ipv6
         self.buffer_size = buffer_size
+        self.framing = framing.lower()
         self.sock = None
         self.connected = False
         self.last_connect_attempt = 0
         self.connect_retry_interval = 10.0  # Retry every 10 seconds
         self.using_ipv6 = False  # Track which protocol connected
+        self._resolved_addr = None  # sockaddr for the TCP host, resolved once per init
+        self._connect_failures = 0  # Consecutive failed connects on the current family
         self.recv_buffer = b''  # Buffer for incoming framed data
+        self._prefix_cache: Dict[str, bytes] = {}  # event_type -> encoded '{"type":...,"timestamp":'
+        self._pending = bytearray()  # Framed events waiting for the next flush
+        self._flush_handle = None  # Scheduled flush (asyncio TimerHandle)
+        self._dropped_events = 0  # Events dropped in the current backlog episode
+        self.on_reconnect: Optional[Callable[[], None]] = None  # Called when the dashboard asks for a state sync
         
         if disable_ipv6 and transport == 'tcp':
             logger.warning('⚠️  IPv6 disabled for dashboard connection - using IPv4 only')
         
-        if not enabled:
-            return
+        # Compact JSON never contains a raw newline, so with 'jsonl' the
+        # message's trailing newline is the whole frame delimiter
+        self._length_prefixed = self.framing != 'jsonl'
+        self._message_format = b'%s%r,"data":%s}' if self._length_prefixed else b'%s%r,"data":%s}\n'
         
         # Initialize transport
-        if self.transport == 'tcp':
+        if not enabled:
+            pass
+        elif self.framing not in ('length', 'jsonl'):
+            logger.error(f"Unknown framing: {framing} (valid options: 'length', 'jsonl'), dashboard disabled")
+            self.enabled = False
+        elif self.transport == 'tcp':
             self._init_tcp()
         elif self.transport == 'unix':
             self._init_unix()
         else:
             logger.error(f"Unknown transport: {transport} (valid options: 'tcp', 'unix'), dashboard disabled")
             self.enabled = False
+        
+        # Disabled (by config or a failed init) stays disabled, so shadow emit
+        # with a no-op instead of testing self.enabled on every event
+        if not self.enabled:
+            self.emit = _emit_disabled
     
     def _init_tcp(self):
         """Initialize TCP socket (connection-oriented) - tries IPv6 first, falls back to IPv4"""
         # Try IPv6 first if configured
         if self.host_ipv6:
             try:
-                self.sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
-                self.sock.setblocking(False)
-                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
-                _tune_tcp_keepalive(self.sock)
                 self.using_ipv6 = True
+                self._resolved_addr = socket.getaddrinfo(
+                    self.host_ipv6, self.port, socket.AF_INET6, socket.SOCK_STREAM)[0][4]
+                self._create_tcp_socket()
                 self._try_connect()
                 logger.info(f"📡 TCP event emitter initialized for [{self.host_ipv6}]:{self.port} (IPv6)")
+                logger.debug(f"Kernel send buffer: {self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)} bytes")
                 return
             except Exception as e:
                 logger.warning(f"IPv6 connection failed: {e}, trying IPv4...")
@@ -110,14 +202,13 @@ class EventEmitter:
         # Fall back to IPv4
         if self.host_ipv4:
             try:
-                self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.sock.setblocking(False)
-                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
-                _tune_tcp_keepalive(self.sock)
                 self.using_ipv6 = False
+                self._resolved_addr = socket.getaddrinfo(
+                    self.host_ipv4, self.port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+                self._create_tcp_socket()
                 self._try_connect()
                 logger.info(f"📡 TCP event emitter initialized for {self.host_ipv4}:{self.port} (IPv4)")
+                logger.debug(f"Kernel send buffer: {self.sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF)} bytes")
                 return
             except Exception as e:
                 logger.error(f"Failed to initialize TCP socket (IPv4): {e}")
@@ -129,9 +220,7 @@ class EventEmitter:
     def _init_unix(self):
         """Initialize Unix domain socket (connection-oriented, local only)"""
         try:
-            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self.sock.setblocking(False)
-            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
+            self._create_unix_socket()
             
             # Attempt connection (non-blocking)
             self._try_connect()
@@ -141,6 +230,20 @@ class EventEmitter:
             logger.error(f"Failed to initialize Unix socket: {e}")
             self.enabled = False
     
+    def _create_tcp_socket(self):
+        """Create the TCP socket for the address family chosen by _init_tcp"""
+        sock = _nonblocking_stream_socket(socket.AF_INET6 if self.using_ipv6 else socket.AF_INET)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        _limit_tcp_unsent(sock)
+        _tune_tcp_keepalive(sock)
+        self.sock = sock
+    
+    def _create_unix_socket(self):
+        """Create the Unix domain socket"""
+        sock = _nonblocking_stream_socket(socket.AF_UNIX)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
+        self.sock = sock
+    
     def _try_connect(self):
         """Attempt non-blocking connection (TCP/Unix only)"""
         now = time()
@@ -150,74 +253,114 @@ class EventEmitter:
         self.last_connect_attempt = now
         
         try:
-            # Ensure we have a socket object to call connect() on. Some code paths
-            # (e.g. recv detected closed connection) set self.sock = None. Create a
-            # fresh socket here when needed.
+            # Ensure we have a socket object to call connect() on. A lost
+            # connection only closes the socket (self.sock = None); the new one
+            # keeps the address and family _init_tcp settled on, so reconnects
+            # don't repeat the IPv6/IPv4 probing
             if not self.sock:
                 if self.transport == 'tcp':
-                    # Create either IPv6 or IPv4 socket depending on configuration
-                    if self.host_ipv6 and self.using_ipv6:
-                        self.sock = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
-                    else:
-                        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    self.sock.setblocking(False)
-                    try:
-                        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
-                        _tune_tcp_keepalive(self.sock)
-                    except Exception:
-                        # Non-fatal if setsockopt not supported in environment
-                        pass
+                    self._create_tcp_socket()
                 elif self.transport == 'unix':
-                    self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                    self.sock.setblocking(False)
-                    try:
-                        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.buffer_size)
-                    except Exception:
-                        pass
+                    self._create_unix_socket()
 
             if self.transport == 'tcp':
-                host = self.host_ipv6 if self.using_ipv6 else self.host_ipv4
-                self.sock.connect((host, self.port))
+                self.sock.connect(self._resolved_addr)
             elif self.transport == 'unix':
                 self.sock.connect(self.unix_socket)
 
             self.connected = True
+            self._connect_failures = 0
             logger.info(f"✅ Connected to dashboard ({self.transport})")
+            return
         except BlockingIOError:
             # Connection in progress (non-blocking), will complete later
-            pass
+            return
         except (ConnectionRefusedError, FileNotFoundError) as e:
             # Dashboard not running yet (expected)
             if not self.connected:  # Only log once
                 logger.debug(f"Dashboard not available yet ({self.transport}): {e}")
             self.connected = False
+            self._connect_failures = 0
         except Exception as e:
             logger.warning(f"Connection attempt failed ({self.transport}): {e}")
             self.connected = False
+            # Keep using the family that last worked, but don't stay stuck on
+            # one the dashboard can't be reached over (e.g. broken IPv6 routing)
+            if isinstance(e, TimeoutError) or getattr(e, 'errno', None) in _UNREACHABLE_ERRNOS:
+                self._connect_failures += 1
+                if (self.transport == 'tcp' and self.host_ipv6 and self.host_ipv4
+                        and self._connect_failures >= TCP_FAMILY_SWITCH_FAILURES):
+                    self._switch_tcp_family()
+    
+    def _switch_tcp_family(self):
+        """Retry the dashboard over the other address family"""
+        use_ipv6 = not self.using_ipv6
+        host = self.host_ipv6 if use_ipv6 else self.host_ipv4
+        family = socket.AF_INET6 if use_ipv6 else socket.AF_INET
+        try:
+            resolved_addr = socket.getaddrinfo(host, self.port, family, socket.SOCK_STREAM)[0][4]
+        except OSError as e:
+            logger.debug(f"Cannot resolve dashboard host {host}: {e}")
+            return
+        
+        logger.debug(f"🔁 Dashboard unreachable over {'IPv4' if use_ipv6 else 'IPv6'}, "
+                     f"trying {'IPv6' if use_ipv6 else 'IPv4'}")
+        self._close_socket()
+        self.using_ipv6 = use_ipv6
+        self._resolved_addr = resolved_addr
+        self._connect_failures = 0
     
-    def emit(self, event_type: str, data: Dict[str, Any]) -> None:
+    def emit(self, event_type: str, data: Dict[str, Any],
+             _time=time, _encode=_encode_event,
+             _pack_length=_FRAME_HEADER.pack) -> None:
         """
         Send event to dashboard (non-blocking, never blocks HBlink)
         
         Args:
             event_type: Type of event (e.g., 'stream_start', 'repeater_connected')
             data: Event data dictionary
-        """
-        if not self.enabled:
-            return
         
+        _time, _encode and _pack_length are bound at definition time so the per-event path
+        uses fast locals instead of global lookups; callers never pass them.
+        """
         try:
-            message = json.dumps({
-                'type': event_type,
-                'timestamp': time(),
-                'data': data
-            }, separators=(',', ':'))  # Compact JSON
+            # Only 'data' goes through the encoder; the envelope around it is
+            # spliced from a cached per-type prefix and the timestamp's repr,
+            # which is exactly what json.dumps would have written for it
+            prefix_cache = self._prefix_cache
+            prefix = prefix_cache.get(event_type)
+            if prefix is None:
+                prefix = prefix_cache[event_type] = (
+                    _encode({'type': event_type})[:-1] + b',"timestamp":')
+            message_bytes = self._message_format % (prefix, _time(), _encode(data))
             
-            message_bytes = message.encode('utf-8')
+            # Queue for the stream transport (TCP or Unix socket). Done inline
+            # rather than in a helper: this runs for every event, and a Python
+            # call frame costs about as much as the framing itself
+            if not self.connected:
+                self._try_connect()
+                if not self.connected:
+                    return  # Still not connected, drop event
             
-            # Send via stream transport (TCP or Unix socket)
-            self._send_stream(message_bytes)
+            pending = self._pending
+            if len(pending) >= EVENT_BACKLOG_LIMIT:
+                # Dashboard not draining, drop event
+                if not self._dropped_events:
+                    logger.warning("⚠️  Dashboard not keeping up - dropping events until it drains")
+                self._dropped_events += 1
+                return
+            
+            # Frame message with length prefix (4 bytes, big-endian) unless
+            # it already ends in its JSONL newline
+            if self._length_prefixed:
+                pending += _pack_length(len(message_bytes))
+            pending += message_bytes
+            
+            if len(pending) >= EVENT_FLUSH_BYTES:
+                self._flush()
+            elif self._flush_handle is None and not self._schedule_flush():
+                # No event loop (startup/shutdown): send right away
+                self._flush()
                 
         except Exception as e:
             # Never raise - dashboard is optional
@@ -248,8 +391,7 @@ class EventEmitter:
             if data == b'':
                 logger.warning("Dashboard connection closed (recv returned empty bytes)")
                 self.connected = False
-                self.sock.close()
-                self.sock = None
+                self._close_socket()
                 self.recv_buffer = b''
                 return
             
@@ -257,24 +399,13 @@ class EventEmitter:
                 self.recv_buffer += data
                 
                 # Process all complete frames in buffer
-                while len(self.recv_buffer) >= 4:
-                    # Read length prefix (4 bytes, big-endian)
-                    length = int.from_bytes(self.recv_buffer[:4], byteorder='big')
-                    
-                    # Check if we have complete frame
-                    if len(self.recv_buffer) < 4 + length:
-                        break  # Wait for more data
-                    
-                    # Extract frame
-                    frame = self.recv_buffer[4:4+length]
-                    self.recv_buffer = self.recv_buffer[4+length:]
-                    
+                for frame in self._take_frames():
                     # Parse and handle message
                     try:
                         message = json.loads(frame.decode('utf-8'))
                         if message.get('type') == 'sync_request':
                             logger.info("📥 Received sync_request from dashboard - sending initial state")
-                            if hasattr(self, 'on_reconnect'):
+                            if self.on_reconnect is not None:
                                 self.on_reconnect()
                     except json.JSONDecodeError as e:
                         logger.warning(f"Received invalid JSON from dashboard: {e}")
@@ -285,59 +416,94 @@ class EventEmitter:
             # Socket error indicates connection is broken
             logger.warning(f"Dashboard connection error detected: {e}")
             self.connected = False
-            if self.sock:
-                try:
-                    self.sock.close()
-                except:
-                    pass
-                self.sock = None
+            self._close_socket()
             self.recv_buffer = b''
     
-    def _send_stream(self, data: bytes):
-        """Send via TCP or Unix socket (connection-oriented)"""
-        # Try to reconnect if disconnected
-        was_disconnected = not self.connected
-        if not self.connected:
-            self._try_connect()
+    def _schedule_flush(self) -> bool:
+        """Schedule a flush on the running event loop; False if there is none"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._flush_handle = loop.call_later(EVENT_FLUSH_DELAY, self._flush)
+        return True
+    
+    def _take_frames(self) -> List[bytes]:
+        """Remove and return the complete frames in recv_buffer"""
+        frames = []
+        if self._length_prefixed:
+            buffer = self.recv_buffer
+            offset = 0
+            end = len(buffer)
+            while end - offset >= 4:
+                # Read length prefix (4 bytes, big-endian)
+                length, = _FRAME_HEADER.unpack_from(buffer, offset)
+                
+                # Check if we have complete frame
+                if end - offset - 4 < length:
+                    break  # Wait for more data
+                
+                # Extract frame
+                offset += 4
+                frames.append(buffer[offset:offset + length])
+                offset += length
+            self.recv_buffer = buffer[offset:]
+        else:
+            # Last piece is an incomplete line (or b'')
+            *lines, self.recv_buffer = self.recv_buffer.split(b'\n')
+            frames = [line for line in lines if line]
+        return frames
+    
+    def _flush(self):
+        """Send all queued frames in a single call"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         
+        pending = self._pending
+        if not pending:
+            return
         if not self.connected:
-            return  # Still not connected, drop event
-        
-        # Check for incoming sync requests from dashboard (non-blocking)
-        self._check_sync_request()
+            pending.clear()
+            return
         
         try:
-            # Frame message with length prefix (4 bytes, big-endian)
-            length = len(data)
-            frame = length.to_bytes(4, byteorder='big') + data
+            # Non-blocking send. Whatever the kernel won't take stays queued
+            # for the next flush: dropping a partially sent frame would leave
+            # the dashboard unable to find the next length prefix
+            sent = 0
+            with memoryview(pending) as view:
+                try:
+                    while sent < len(view):
+                        sent += self.sock.send(view[sent:])
+                except BlockingIOError:
+                    pass
+            del pending[:sent]
             
-            # Non-blocking send
-            self.sock.sendall(frame)
+            if pending:
+                self._schedule_flush()
+            elif self._dropped_events:
+                logger.info(f"Dashboard caught up ({self._dropped_events} events dropped)")
+                self._dropped_events = 0
             
-            # If we just reconnected, check immediately for sync request
+            # Check for incoming sync requests from dashboard (non-blocking).
             # Dashboard sends sync_request as soon as connection is made
-            if was_disconnected:
-                self._check_sync_request()
+            self._check_sync_request()
             
         except (BrokenPipeError, ConnectionResetError, OSError) as e:
-            # Connection lost
+            # Connection lost; the next emit reconnects with a fresh socket
             logger.warning(f"Dashboard connection lost: {e}")
             self.connected = False
             self._close_socket()
-            
-            # Recreate socket for next connection attempt
-            if self.transport == 'tcp':
-                self._init_tcp()
-            elif self.transport == 'unix':
-                self._init_unix()
-        except BlockingIOError:
-            # Send buffer full, drop event (prevents blocking)
-            pass
         except Exception as e:
+            pending.clear()
             logger.debug(f"Send failed: {e}")
     
     def _close_socket(self):
         """Close socket safely"""
+        # Queued bytes belong to this connection's framing; never replay them
+        # (possibly mid-frame) onto the next one
+        self._pending.clear()
         if self.sock:
             try:
                 self.sock.close()
@@ -348,6 +514,7 @@ class EventEmitter:
     def close(self):
         """Close connection and cleanup"""
         if self.enabled:
+            self._flush()
             self._close_socket()
             self.connected = False
             logger.info(f"Event emitter closed ({self.transport})")
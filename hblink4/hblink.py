@@ -15,6 +15,7 @@ import logging.handlers
 import pathlib
 import ipaddress
 import socket
+import struct
 from typing import Dict, Any, Optional, Tuple, Union, List, Set
 from time import time
 from random import randint
@@ -97,6 +98,44 @@ except ImportError:
         dtype_name, decode_data_header,
     )
 
+# Inbound command dispatch, keyed on the 4-byte command prefix:
+#   command -> (repeater_id slice, payload offset, handler method, description)
+# Handlers are called as handler(repeater_id, data[payload offset:], addr).
+# RPTCL shares the RPTC prefix and is resolved in datagram_received.
+_RPTC_DISPATCH = (slice(4, 8), 0, '_handle_config', 'RPTC (Configuration Data)')
+_RPTCL_DISPATCH = (slice(5, 9), 0, '_handle_disconnect', 'RPTCL (Disconnect Request)')
+_COMMAND_DISPATCH = {
+    DMRD: (slice(11, 15), 0, '_handle_dmr_data', None),  # per-packet, never logged
+    RPTL: (slice(4, 8), 0, '_handle_repeater_login', 'RPTL (Repeater Login Request)'),
+    RPTK: (slice(4, 8), 8, '_handle_auth_response', 'RPTK (Authentication Response)'),
+    RPTC: _RPTC_DISPATCH,
+    RPTP: (slice(7, 11), 0, '_handle_ping', 'RPTPING (Repeater Keepalive)'),
+    RPTO: (slice(4, 8), 8, '_handle_options', 'RPTO (Options/TG Configuration)'),
+    DMRA: (slice(4, 8), 8, '_handle_talker_alias', 'DMRA (DMR Talker Alias)'),
+}
+
+# RPTC configuration block following the 8-byte 'RPTC' + repeater_id header:
+# callsign, rx_freq, tx_freq, tx_power, colorcode, latitude, longitude,
+# height, location, description, slots, url, software_id, package_id
+_RPTC_CONFIG = struct.Struct('8s9s9s2s2s8s9s3s20s19s1s124s40s40s')
+_RPTC_CONFIG_END = 8 + _RPTC_CONFIG.size  # 302
+
+# DMRD header: seq, rf_src, dst_id, bits (slot/call type/frame type/dtype),
+# stream_id. The 'DMRD' prefix and the repeater_id at 11-14 (already sliced
+# by the dispatcher) are skipped; the 33-byte DMR payload follows at offset 20.
+_DMRD_HEADER = struct.Struct('4xB3s3s4xB4s')
+_DMRD_MIN_LEN = 55
+
+# DMRD bits byte (offset 15) decoded for every possible value:
+#   bits -> (slot, call_type, frame_type, dtype_vseq, is_terminator)
+# is_terminator is protocol.is_dmr_terminator's rule (data sync frame carrying
+# a voice terminator), precomputed so the per-packet paths skip the call.
+_BITS_DECODE = tuple(
+    (2 if b & 0x80 else 1, (b & 0x40) >> 6, (b & 0x30) >> 4, b & 0x0F,
+     (b & 0x30) >> 4 == 2 and b & 0x0F == 2)
+    for b in range(256)
+)
+
 # Data classes moved to models.py
 
 class OutboundProtocol(asyncio.DatagramProtocol):
@@ -127,11 +166,20 @@ class OpenBridgeProtocol(asyncio.DatagramProtocol):
 
 
 class HBProtocol(asyncio.DatagramProtocol):
-    """UDP Implementation of HomeBrew DMR Server Protocol"""
+    """UDP Implementation of HomeBrew DMR Server Protocol
+
+    Stream end detection is two-tier: a terminator frame ends a stream
+    immediately in _handle_dmr_data, and the periodic stream sweep ends any
+    stream that goes quiet (lost terminator) as the fallback. Either way the
+    slot then enters hang time, which keeps it reserved so a conversation
+    can't be hijacked between overs.
+    """
     def __init__(self, *args, **kwargs):
         super().__init__()
         # All inbound connections (repeaters, hotspots, network links) - see models.py terminology note
         self._repeaters: Dict[bytes, RepeaterState] = {}
+        # Reverse index keyed on normalized (ip, port), kept in step with _repeaters
+        self._by_addr: Dict[Tuple[str, int], RepeaterState] = {}
         
         # Outbound connection state management (Phase 2)
         self._outbounds: Dict[str, 'OutboundState'] = {}  # keyed by connection name
@@ -149,6 +197,13 @@ class HBProtocol(asyncio.DatagramProtocol):
         self._tasks = []  # List to track all async tasks
 
         self._port = None  # Store the port instance instead of transport
+        self._sendto = None  # Bound transport.sendto, set in connection_made
+
+        # Wall-clock time cached once per inbound datagram (repeater, outbound
+        # and OpenBridge sockets alike) and per periodic sweep, so per-packet
+        # handlers and the forwarding fan-out read an attribute instead of
+        # calling time() several times for the same packet.
+        self._now: float = 0.0
         
         # Initialize dashboard event emitter with config
         dashboard_config = CONFIG.get('dashboard', {})
@@ -160,7 +215,8 @@ class HBProtocol(asyncio.DatagramProtocol):
             port=dashboard_config.get('port', 8765),
             unix_socket=dashboard_config.get('unix_socket', '/tmp/hblink4.sock'),
             disable_ipv6=dashboard_config.get('disable_ipv6', False),
-            buffer_size=dashboard_config.get('buffer_size', 65536)
+            buffer_size=dashboard_config.get('buffer_size', 65536),
+            framing=dashboard_config.get('framing', 'length')
         )
         
         # Register reconnect callback to send current state when dashboard connects
@@ -169,6 +225,13 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Active call tracking for contention management
         self._active_calls = 0  # Currently active forwarded calls
         
+        # Slots currently holding a stream, so the 1 Hz stream sweep visits
+        # only those rather than every connected repeater and outbound.
+        # Entries are added when a stream is set and dropped once the slot
+        # is found empty (cleared, or its owner reconnected/removed).
+        self._live_repeater_slots: Set[Tuple[bytes, int]] = set()
+        self._live_outbound_slots: Set[Tuple[str, int]] = set()
+        
         # Track denied streams to avoid repeated logging
         # Key: (repeater_id, slot, stream_id), Value: timestamp of first denial
         self._denied_streams: Dict[tuple, float] = {}
@@ -269,6 +332,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             rid_to_int(repeater_id),
             repeater.get_callsign_str()
         )
+        repeater.repeater_config = repeater_config
         
         # Convert config to internal representation:
         # None stays None (allow all), int lists become bytes sets for hot path performance
@@ -517,6 +581,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         Handle packets received from outbound server connections.
         Implements client-side HomeBrew protocol state machine.
         """
+        self._now = time()
         ip = addr[0]
         port = addr[1]
         
@@ -626,7 +691,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             
             # MSTPONG - Keepalive response
             elif _command == MSTPONG:
-                state.last_pong = time()
+                state.last_pong = self._now
                 state.missed_pongs = 0
                 LOGGER.debug(f'[{connection_name}] Received MSTPONG')
             
@@ -706,7 +771,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Parse packet using unified parser
         packet = self._parse_dmr_packet(data)
         if not packet:
-            LOGGER.warning(f'[{outbound_state.config.name}] Invalid DMRD packet length: {len(data)}')
+            LOGGER.warning('[%s] Invalid DMRD packet length: %d', outbound_state.config.name, len(data))
             return
         
         # Extract fields from parsed packet
@@ -744,6 +809,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 cache_outbound_name=conn_name,
             )
             outbound_state.set_slot_stream(_slot, new_stream)
+            self._live_outbound_slots.add((outbound_state.config.name, _slot))
             emit_call_type = 'private' if _call_type == 1 else 'group'
             self._emit_stream_start(
                 'outbound', conn_name, _slot, _rf_src, _dst_id, _stream_id,
@@ -769,12 +835,14 @@ class HBProtocol(asyncio.DatagramProtocol):
         
         # None = allow all, empty set = deny all, non-empty set = specific TGs
         if allowed_tgs is not None and (not allowed_tgs or _dst_id not in allowed_tgs):
-            LOGGER.debug(f'[{outbound_state.config.name}] Dropping packet for unauthorized TG {packet["dst_id_int"]} on slot {_slot}')
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('[%s] Dropping packet for unauthorized TG %d on slot %d',
+                             outbound_state.config.name, packet['dst_id_int'], _slot)
             return
         
         # Track stream state on outbound connection's TDMA slot (RX stream from remote server)
-        current_stream = outbound_state.get_slot_stream(_slot)
-        current_time = time()
+        current_stream = outbound_state.streams[_slot - 1]
+        current_time = self._now
         
         if not current_stream or current_stream.stream_id != _stream_id:
             # New RX stream from remote server - check if slot is busy with assumed (TX) stream
@@ -799,6 +867,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 is_assumed=False  # Real RX stream
             )
             outbound_state.set_slot_stream(_slot, new_stream)
+            self._live_outbound_slots.add((outbound_state.config.name, _slot))
             
             # Emit stream_start event for dashboard (RX stream from remote)
             self._emit_stream_start(
@@ -846,7 +915,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Capture the stream's source-of-truth LC once (from VHEAD if this
         # frame is one, else synthesize). outbound-sourced streams use their
         # own StreamState on outbound_state to hold lc_base / lc_cache.
-        rx_stream = outbound_state.get_slot_stream(_slot)
+        rx_stream = outbound_state.streams[_slot - 1]
         if rx_stream is not None and rx_stream.lc_base is None:
             decoded_lc = None
             if lc_carrier == LC_CARRIER_VHEAD:
@@ -860,7 +929,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 continue
 
             # ACL on network vocabulary
-            if not self._check_outbound_routing(local_repeater_id, _slot, _dst_id):
+            if not self._check_outbound_routing(local_repeater, _slot, _dst_id):
                 continue
 
             # Translate net → target-local for slot busy / packet rewrite
@@ -887,8 +956,10 @@ class HBProtocol(asyncio.DatagramProtocol):
                 and rx_stream.lc_base is not None
                 and out_dst != _dst_id
             )
+            # Forwarding goes straight to the bound sendto: sockaddr is
+            # already a plain (ip, port) tuple, so _send_packet adds nothing
             if header_unchanged and not lc_needs_rewrite:
-                self._send_packet(data, local_repeater.sockaddr)
+                self._sendto(data, local_repeater.sockaddr)
             else:
                 buf = bytearray(data)
                 if out_dst != _dst_id:
@@ -916,7 +987,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                         buf[20:53] = splice_full_lc(payload, t_lc)
                     elif lc_carrier == LC_CARRIER_EMB:
                         buf[20:53] = splice_emb_lc(payload, emb_lc[_dtype_vseq])
-                self._send_packet(bytes(buf), local_repeater.sockaddr)
+                self._sendto(buf, local_repeater.sockaddr)
             forwarded_count += 1
 
             # Track assumed stream state on local repeater using target-local values
@@ -925,10 +996,10 @@ class HBProtocol(asyncio.DatagramProtocol):
                                        net_slot=_slot, net_dst_id=_dst_id)
         
         # Log forwarding at DEBUG level
-        if forwarded_count > 0:
-            ts_tg = fmt_ts_tg(_slot, _dst_id)
-            LOGGER.debug(f'[{outbound_state.config.name}] Forwarded DMRD '
-                        f'{ts_tg} src={src_id} to {forwarded_count} local repeater(s)')
+        if forwarded_count > 0 and LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug('[%s] Forwarded DMRD %s src=%d to %d local repeater(s)',
+                         outbound_state.config.name, fmt_ts_tg(_slot, _dst_id),
+                         src_id, forwarded_count)
 
 
     def _handle_outbound_unit_call(self, data: bytes, outbound_state: 'OutboundState',
@@ -964,8 +1035,8 @@ class HBProtocol(asyncio.DatagramProtocol):
         # a new transmission — create fresh state, evict any active assumed
         # (TX) stream that happens to be on this slot (RX from the remote
         # wins, same rule as group calls).
-        current_stream = outbound_state.get_slot_stream(_slot)
-        current_time = time()
+        current_stream = outbound_state.streams[_slot - 1]
+        current_time = self._now
 
         if not current_stream or current_stream.stream_id != _stream_id:
             if current_stream and current_stream.is_assumed and not current_stream.ended:
@@ -1001,6 +1072,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 routing_cached=True,
             )
             outbound_state.set_slot_stream(_slot, new_stream)
+            self._live_outbound_slots.add((outbound_state.config.name, _slot))
 
             # Dashboard event
             self._emit_stream_start(
@@ -1022,7 +1094,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             LOGGER.info(
                 f'[{conn_name}] Unit RX stream started TS/RID: {_slot}/{dst_int} '
                 f'src={src_id} targets={len(target_repeaters)} '
-                f'stream_id={_stream_id.hex()} {mode_tag}'
+                f'stream_id={new_stream.stream_id_hex} {mode_tag}'
             )
 
             # Cache the source radio as reachable via this outbound so local
@@ -1043,7 +1115,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Forward to each target. Unit calls never translate, so the packet
         # goes out as-is. We still rewrite the repeater-id header field to
         # the target repeater's id (existing downstream code expects it).
-        source_stream = outbound_state.get_slot_stream(_slot)
+        source_stream = outbound_state.streams[_slot - 1]
         if source_stream is None:
             return
 
@@ -1058,7 +1130,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             if not target_repeater:
                 continue
             # No translation for unit calls — just forward the packet.
-            self._send_packet(data, target_repeater.sockaddr)
+            self._sendto(data, target_repeater.sockaddr)
             self._update_assumed_stream(
                 target_repeater, _slot, _rf_src, _dst_id, _stream_id,
                 is_terminator, remote_repeater_id,
@@ -1081,13 +1153,12 @@ class HBProtocol(asyncio.DatagramProtocol):
         LOGGER.info("Starting graceful shutdown...")
         
         # Send MSTCL to all connected repeaters
-        if self._port:  # Only attempt to send if we have a port
+        if self._sendto:  # Only attempt to send if we have a port
             for repeater_id, repeater in self._repeaters.items():
                 if repeater.connection_state == 'connected':
                     try:
                         LOGGER.info(f"Sending disconnect to repeater {rid_to_int(repeater_id)}")
-                        # asyncio uses sendto() instead of write(data, addr)
-                        self._port.sendto(MSTCL, repeater.sockaddr)
+                        self._sendto(MSTCL, repeater.sockaddr)
                     except Exception as e:
                         LOGGER.error(f"Error sending disconnect to repeater {rid_to_int(repeater_id)}: {e}")
         
@@ -1145,6 +1216,8 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Get the port instance for sending data
         self.transport = transport
         self._port = self.transport
+        # Bind sendto once so each outbound packet skips two attribute lookups
+        self._sendto = transport.sendto
         """Called when transport is connected"""
         # Start timeout checker
         timeout_interval = CONFIG.get('timeout', {}).get('repeater', 30)
@@ -1167,6 +1240,8 @@ class HBProtocol(asyncio.DatagramProtocol):
 
     def connection_lost(self, exc):
         """Called when transport is disconnected"""
+        self._sendto = None
+
         # Cancel all periodic tasks
         for task in self._tasks:
             task.cancel()
@@ -1178,12 +1253,14 @@ class HBProtocol(asyncio.DatagramProtocol):
             
     def _check_repeater_timeouts(self):
         """Check for and handle repeater timeouts. Repeaters should send periodic RPTPING/RPTP."""
-        current_time = time()
+        current_time = self._now = time()
         timeout_duration = CONFIG.get('global', {}).get('timeout_duration', 30)  # 30 second default
         max_missed = CONFIG.get('global', {}).get('max_missed', 3)  # 3 missed pings default
         
-        # Make a list to avoid modifying dict during iteration
-        for repeater_id, repeater in list(self._repeaters.items()):
+        # Collect timed-out repeaters and remove them after the pass, so the
+        # dict is iterated directly instead of copied every sweep
+        timed_out = []
+        for repeater_id, repeater in self._repeaters.items():
             if repeater.connection_state != 'connected':
                 continue
                 
@@ -1191,16 +1268,21 @@ class HBProtocol(asyncio.DatagramProtocol):
             
             if time_since_ping > timeout_duration:
                 repeater.missed_pings += 1
-                LOGGER.warning(f'Repeater {rid_to_int(repeater_id)} missed ping #{repeater.missed_pings}')
+                LOGGER.warning('Repeater %d missed ping #%d', repeater.repeater_id_int, repeater.missed_pings)
                 
                 # Emit event to update dashboard with missed ping count
                 self._events.emit('repeater_connected', self._prepare_repeater_event_data(repeater_id, repeater))
                 
                 if repeater.missed_pings >= max_missed:
-                    LOGGER.error(f'Repeater {rid_to_int(repeater_id)} timed out after {repeater.missed_pings} missed pings')
-                    # Send NAK to trigger re-registration
-                    self._send_nak(repeater_id, (repeater.ip, repeater.port), reason=f"Timeout after {repeater.missed_pings} missed pings")
-                    self._remove_repeater(repeater_id, "timeout")
+                    timed_out.append(repeater)
+
+        for repeater in timed_out:
+            repeater_id = repeater.repeater_id
+            LOGGER.error('Repeater %d timed out after %d missed pings',
+                         repeater.repeater_id_int, repeater.missed_pings)
+            # Send NAK to trigger re-registration
+            self._send_nak(repeater_id, repeater.sockaddr, reason=f"Timeout after {repeater.missed_pings} missed pings", repeater=repeater)
+            self._remove_repeater(repeater_id, "timeout")
     
     def _end_stream(self, stream: StreamState, repeater_id: bytes, slot: int, 
                     current_time: float, end_reason: str) -> None:
@@ -1226,14 +1308,6 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Determine stream type for logging
         stream_type = "TX" if stream.is_assumed else "RX"
         
-        # Build reason text
-        if end_reason == 'terminator':
-            reason_text = f'reason=terminator - entering hang time ({hang_time}s)'
-        elif end_reason == 'fast_terminator':
-            reason_text = f'reason=fast_terminator - entering hang time ({hang_time}s)'
-        else:  # timeout
-            reason_text = f'reason=timeout - entering hang time ({hang_time}s)'
-        
         # Log stream end (DEBUG for TX, INFO for RX). Match stream-start
         # format. Group calls get net/rf translation annotation via fmt_ts_tg;
         # unit (private) calls carry a subscriber ID in dst_id rather than a
@@ -1242,30 +1316,30 @@ class HBProtocol(asyncio.DatagramProtocol):
         # repeater_id is a synthetic dummy that won't be in self._repeaters —
         # we still log, just without translation annotation.
         rid_int = rid_to_int(repeater_id)
-        src_int = int.from_bytes(stream.rf_src, "big")
-        dst_int = int.from_bytes(stream.dst_id, "big")
         # Data streams already logged once at dedupe time by _handle_data_stream;
         # quiet their end line so a busy APRS channel doesn't echo through here.
-        log = (LOGGER.debug if stream_type == "TX" or stream.call_type == "data"
-               else LOGGER.info)
+        log_level = (logging.DEBUG if stream_type == "TX" or stream.call_type == "data"
+                     else logging.INFO)
 
-        if stream.is_unit_call:
-            call_type_prefix = "Unit"
-            ts_addr = f'TS/RID: {slot}/{dst_int}'
-        else:
-            call_type_prefix = "Group"
-            repeater = self._repeaters.get(repeater_id)
-            if repeater and repeater.inbound_map:
-                net_slot, net_dst_id = repeater.inbound_map.get(
-                    (slot, stream.dst_id), (slot, stream.dst_id)
-                )
+        if LOGGER.isEnabledFor(log_level):
+            if stream.is_unit_call:
+                call_type_prefix = "Unit"
+                ts_addr = f'TS/RID: {slot}/{stream.dst_id_int}'
             else:
-                net_slot, net_dst_id = slot, stream.dst_id
-            ts_addr = fmt_ts_tg(net_slot, net_dst_id, slot, stream.dst_id)
+                call_type_prefix = "Group"
+                repeater = self._repeaters.get(repeater_id)
+                if repeater and repeater.inbound_map:
+                    net_slot, net_dst_id = repeater.inbound_map.get(
+                        (slot, stream.dst_id), (slot, stream.dst_id)
+                    )
+                else:
+                    net_slot, net_dst_id = slot, stream.dst_id
+                ts_addr = fmt_ts_tg(net_slot, net_dst_id, slot, stream.dst_id)
 
-        log(f'{call_type_prefix} {stream_type} stream ended on repeater {rid_int} {ts_addr} '
-            f'src={src_int} duration={duration:.2f}s '
-            f'packets={stream.packet_count} {reason_text}')
+            LOGGER.log(log_level,
+                       f'{call_type_prefix} {stream_type} stream ended on repeater {rid_int} {ts_addr} '
+                       f'src={stream.rf_src_int} duration={duration:.2f}s '
+                       f'packets={stream.packet_count} reason={end_reason} - entering hang time ({hang_time}s)')
         
         # Emit stream_end event for repeater card display
         # Dashboard will filter TX streams (is_assumed=True) from Recent Events log
@@ -1356,9 +1430,9 @@ class HBProtocol(asyncio.DatagramProtocol):
 
         event_data = {
             'slot': slot,
-            'src_id': int.from_bytes(stream.rf_src, 'big'),
-            'dst_id': int.from_bytes(stream.dst_id, 'big'),
-            'stream_id': stream.stream_id.hex(),
+            'src_id': stream.rf_src_int,
+            'dst_id': stream.dst_id_int,
+            'stream_id': stream.stream_id_hex,
             'duration': round(duration, 2),
             'packet_count': stream.packet_count,
             'end_reason': end_reason,
@@ -1381,7 +1455,7 @@ class HBProtocol(asyncio.DatagramProtocol):
     def _check_timeout(self, connection_type: str, connection_id: str,
                       slot: int, stream: StreamState, current_time: float,
                       stream_timeout: float, hang_time: float,
-                      synthetic_repeater_id: bytes = None) -> bool:
+                      end_repeater_id: bytes) -> bool:
         """
         Timeout checking for all connection types.
         
@@ -1393,39 +1467,33 @@ class HBProtocol(asyncio.DatagramProtocol):
             current_time: Current timestamp
             stream_timeout: Stream timeout in seconds
             hang_time: Hang time in seconds
-            synthetic_repeater_id: For outbound connections, synthetic ID for _end_stream
+            end_repeater_id: Repeater ID handed to _end_stream (the repeater's own ID,
+                or the outbound's radio ID as a synthetic repeater ID)
             
         Returns:
             True if slot should be cleared, False otherwise
         """
-        if not stream.is_active(stream_timeout):
+        if not stream.is_active(current_time, stream_timeout):
             if not stream.ended:
                 # Stream just ended - use unified ending logic
-                if connection_type == 'repeater':
-                    # For repeaters, connection_id is the repeater_id as bytes
-                    rid_bytes = connection_id if isinstance(connection_id, bytes) else int(connection_id).to_bytes(4, 'big')
-                else:
-                    # For outbound, use synthetic repeater_id 
-                    rid_bytes = synthetic_repeater_id
-                    
-                self._end_stream(stream, rid_bytes, slot, current_time, 'timeout')
+                self._end_stream(stream, end_repeater_id, slot, current_time, 'timeout')
                 return False  # Don't clear yet - entering hang time
                 
-            elif not stream.is_in_hang_time(stream_timeout, hang_time):
+            elif not stream.is_in_hang_time(current_time, stream_timeout, hang_time):
                 # Hang time expired - clear the slot
-                hang_duration = current_time - stream.end_time if stream.end_time else 0
-                stream_type = "TX" if stream.is_assumed else "RX"
-                
-                # Log with appropriate connection identifier
-                if connection_type == 'repeater':
-                    conn_display = f"repeater {connection_id}"
-                else:
-                    conn_display = f"outbound {connection_id}"
-                    
-                LOGGER.debug(f'{stream_type} hang time completed on {conn_display} slot {slot}: '
-                           f'src={int.from_bytes(stream.rf_src, "big")}, '
-                           f'dst={int.from_bytes(stream.dst_id, "big")}, '
-                           f'hang_duration={hang_duration:.2f}s')
+                if LOGGER.isEnabledFor(logging.DEBUG):
+                    hang_duration = current_time - stream.end_time if stream.end_time else 0
+                    stream_type = "TX" if stream.is_assumed else "RX"
+
+                    # Log with appropriate connection identifier
+                    if connection_type == 'repeater':
+                        conn_display = f"repeater {connection_id}"
+                    else:
+                        conn_display = f"outbound {connection_id}"
+
+                    LOGGER.debug('%s hang time completed on %s slot %d: src=%d, dst=%d, hang_duration=%.2fs',
+                                 stream_type, conn_display, slot,
+                                 stream.rf_src_int, stream.dst_id_int, hang_duration)
                 
                 # Emit hang_time_expired event with appropriate format
                 if connection_type == 'repeater':
@@ -1445,49 +1513,9 @@ class HBProtocol(asyncio.DatagramProtocol):
         
         return False  # Stream still active or in hang time
     
-    def _check_slot_timeout(self, repeater_id: bytes, repeater: RepeaterState, slot: int, 
-                           stream: StreamState, current_time: float, stream_timeout: float, 
-                           hang_time: float) -> bool:
-        """
-        Check and handle timeout for a single slot stream.
-        
-        Returns:
-            True if slot should be cleared, False otherwise
-        """
-        return self._check_timeout(
-            'repeater',
-            rid_to_int(repeater_id),
-            slot,
-            stream,
-            current_time,
-            stream_timeout,
-            hang_time,
-            repeater_id  # Pass as synthetic_repeater_id for consistency
-        )
-
-    def _check_outbound_slot_timeout(self, conn_name: str, outbound: OutboundState, slot: int,
-                                   stream: StreamState, current_time: float, stream_timeout: float,
-                                   hang_time: float) -> bool:
-        """
-        Check and handle timeout for a single outbound slot stream.
-        
-        Returns:
-            True if slot should be cleared, False otherwise
-        """
-        return self._check_timeout(
-            'outbound',
-            conn_name,
-            slot,
-            stream,
-            current_time,
-            stream_timeout,
-            hang_time,
-            outbound.config.radio_id.to_bytes(4, 'big')  # synthetic_repeater_id
-        )
-    
     def _check_stream_timeouts(self):
         """Check for and clean up stale streams on all repeaters"""
-        current_time = time()
+        current_time = self._now = time()
         stream_timeout = CONFIG.get('global', {}).get('stream_timeout', 2.0)
         hang_time = CONFIG.get('global', {}).get('stream_hang_time', 3.0)
         
@@ -1495,38 +1523,38 @@ class HBProtocol(asyncio.DatagramProtocol):
         if hasattr(self, '_events') and self._events:
             self._events.check_for_sync_request()
         
-        for repeater_id, repeater in self._repeaters.items():
+        # Only slots that hold a stream are visited; empty ones are dropped
+        live_slots = self._live_repeater_slots
+        for key in tuple(live_slots):
+            repeater_id, slot = key
+            repeater = self._repeaters.get(repeater_id)
+            stream = repeater.get_slot_stream(slot) if repeater else None
+            if stream is None:
+                live_slots.discard(key)
+                continue
             if repeater.connection_state != 'connected':
                 continue
-            
-            # Check slot 1
-            if repeater.slot1_stream:
-                if self._check_slot_timeout(repeater_id, repeater, 1, repeater.slot1_stream,
-                                           current_time, stream_timeout, hang_time):
-                    repeater.slot1_stream = None
-            
-            # Check slot 2
-            if repeater.slot2_stream:
-                if self._check_slot_timeout(repeater_id, repeater, 2, repeater.slot2_stream,
-                                           current_time, stream_timeout, hang_time):
-                    repeater.slot2_stream = None
+            if self._check_timeout('repeater', repeater.repeater_id_int, slot, stream,
+                                   current_time, stream_timeout, hang_time, repeater_id):
+                repeater.set_slot_stream(slot, None)
+                live_slots.discard(key)
         
         # Check outbound connections for hang time expiration
-        for conn_name, outbound in self._outbounds.items():
+        live_slots = self._live_outbound_slots
+        for key in tuple(live_slots):
+            conn_name, slot = key
+            outbound = self._outbounds.get(conn_name)
+            stream = outbound.get_slot_stream(slot) if outbound else None
+            if stream is None:
+                live_slots.discard(key)
+                continue
             if not outbound.authenticated:
                 continue
-                
-            # Check slot 1
-            if outbound.slot1_stream:
-                if self._check_outbound_slot_timeout(conn_name, outbound, 1, outbound.slot1_stream,
-                                                   current_time, stream_timeout, hang_time):
-                    outbound.slot1_stream = None
-            
-            # Check slot 2
-            if outbound.slot2_stream:
-                if self._check_outbound_slot_timeout(conn_name, outbound, 2, outbound.slot2_stream,
-                                                   current_time, stream_timeout, hang_time):
-                    outbound.slot2_stream = None
+            if self._check_timeout('outbound', conn_name, slot, stream,
+                                   current_time, stream_timeout, hang_time,
+                                   outbound.config.radio_id.to_bytes(4, 'big')):
+                outbound.set_slot_stream(slot, None)
+                live_slots.discard(key)
 
         # Reap stale OpenBridge streams. OBP is stream-multiplexed (no slot to
         # protect and no hang time), so a stream is simply dropped once it ends
@@ -1600,7 +1628,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         except Exception as e:
             LOGGER.error(f'Error sending initial state: {e}')
     
-    def _check_inbound_routing(self, repeater_id: bytes, slot: int, dst_id: bytes) -> bool:
+    def _check_inbound_routing(self, repeater: RepeaterState, slot: int, dst_id: bytes) -> bool:
         """
         Check if a repeater is allowed to send traffic on this TS/TGID.
 
@@ -1610,18 +1638,13 @@ class HBProtocol(asyncio.DatagramProtocol):
         sets are always kept in network-side vocabulary.
 
         Args:
-            repeater_id: Repeater ID to check
+            repeater: Sending repeater's state
             slot: Timeslot (1 or 2) — as received from the repeater (local)
             dst_id: Destination TGID as 3-byte DMR format — as received (local)
 
         Returns:
             True if traffic is allowed, False otherwise
         """
-        # Get repeater state
-        repeater = self._repeaters.get(repeater_id)
-        if not repeater:
-            return False
-
         # Translate local→network before ACL so subscription set (network-side)
         # and the packet's addressing line up.
         if repeater.inbound_map:
@@ -1643,14 +1666,11 @@ class HBProtocol(asyncio.DatagramProtocol):
         if allowed_tgids is None:
             return True
         
-        # Empty set means deny all
-        if not allowed_tgids:
-            return False
-        
         # O(1) set membership check with no bytes→int conversion!
+        # (an empty set denies all)
         return dst_id in allowed_tgids
     
-    def _check_outbound_routing(self, repeater_id: bytes, slot: int, dst_id: bytes) -> bool:
+    def _check_outbound_routing(self, repeater: RepeaterState, slot: int, dst_id: bytes) -> bool:
         """
         Check if traffic should be forwarded to this repeater on this TS/TGID.
         
@@ -1658,18 +1678,13 @@ class HBProtocol(asyncio.DatagramProtocol):
         Same set and logic as inbound - symmetric routing.
         
         Args:
-            repeater_id: Repeater ID to check
+            repeater: Target repeater's state
             slot: Timeslot (1 or 2)  
             dst_id: Destination TGID as 3-byte DMR format
             
         Returns:
             True if traffic should be forwarded, False otherwise
         """
-        # Get repeater state
-        repeater = self._repeaters.get(repeater_id)
-        if not repeater:
-            return False
-        
         # Get slot-specific talkgroup set from repeater state
         allowed_tgids = repeater.slot1_talkgroups if slot == 1 else repeater.slot2_talkgroups
         
@@ -1677,11 +1692,8 @@ class HBProtocol(asyncio.DatagramProtocol):
         if allowed_tgids is None:
             return True
         
-        # Empty set means deny all
-        if not allowed_tgids:
-            return False
-        
         # O(1) set membership check with no bytes→int conversion!
+        # (an empty set denies all)
         return dst_id in allowed_tgids
     
     def _is_slot_busy(self, repeater_id: bytes, slot: int, stream_id: bytes,
@@ -1769,6 +1781,9 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Note: Outbound connections have their own protocol instances (OutboundProtocol)
         # so they never hit this method - this is ONLY for inbound repeater connections
         
+        # Sample the clock once; handlers below read self._now
+        self._now = time()
+
         # Debug log the raw packet
         #LOGGER.debug(f'Raw packet from {ip}:{port}: {data.hex()}')
             
@@ -1777,25 +1792,24 @@ class HBProtocol(asyncio.DatagramProtocol):
         #LOGGER.debug(f'Command bytes: {_command}')
         
         try:
-            # Extract repeater_id based on packet type
-            repeater_id = None
-            if _command == DMRD:
+            # Fast path: DMRD from a connected repeater with no missed pings
+            # to clear is nearly all inbound traffic. Everything else (NAKs,
+            # missed-ping reset events, control packets) takes the generic path.
+            if _command == DMRD and len(data) >= 15:
                 repeater_id = data[11:15]
-            elif _command == RPTP:
-                repeater_id = data[7:11]
-            elif _command == RPTL:
-                repeater_id = data[4:8]
-            elif _command == RPTK:
-                repeater_id = data[4:8]
-            elif _command == RPTO:
-                repeater_id = data[4:8]
-            elif _command == DMRA:
-                repeater_id = data[4:8]
-            elif _command == RPTC:
-                if data[:5] == RPTCL:
-                    repeater_id = data[5:9]
-                else:
-                    repeater_id = data[4:8]
+                repeater = self._repeaters.get(repeater_id)
+                if (repeater is not None and not repeater.missed_pings
+                        and repeater.connection_state == 'connected'):
+                    repeater.last_ping = self._now
+                    self._handle_dmr_data(repeater_id, data, addr)
+                    return
+
+            # Look up handler and repeater_id position for this packet type
+            entry = _COMMAND_DISPATCH.get(_command)
+            if entry is _RPTC_DISPATCH and data[:5] == RPTCL:
+                entry = _RPTCL_DISPATCH
+            # A datagram too short to hold the whole ID is treated as unknown
+            repeater_id = data[entry[0]] if entry and len(data) >= entry[0].stop else None
                 
             if not repeater_id:
                 # Unknown packet type - log full details for investigation
@@ -1803,10 +1817,10 @@ class HBProtocol(asyncio.DatagramProtocol):
                     cmd_str = _command.decode('utf-8', errors='replace')
                 except:
                     cmd_str = _command.hex()
-                LOGGER.warning(f'⚠️  UNKNOWN PACKET TYPE from {ip}:{port}')
-                LOGGER.warning(f'    Command: {cmd_str} (hex: {_command.hex()})')
-                LOGGER.warning(f'    Full packet (first 60 bytes): {data[:60].hex()}')
-                LOGGER.warning(f'    Packet length: {len(data)} bytes')
+                LOGGER.warning('⚠️  UNKNOWN PACKET TYPE from %s:%s', ip, port)
+                LOGGER.warning('    Command: %s (hex: %s)', cmd_str, _command.hex())
+                LOGGER.warning('    Full packet (first 60 bytes): %s', data[:60].hex())
+                LOGGER.warning('    Packet length: %d bytes', len(data))
                 return
 
             # Per-packet logging - only enable for heavy troubleshooting
@@ -1816,13 +1830,13 @@ class HBProtocol(asyncio.DatagramProtocol):
             repeater = self._repeaters.get(repeater_id)
             
             # If repeater is not registered and this is not a login or auth packet, send NAK and return
-            if not repeater and _command not in [RPTL, RPTK]:
+            if not repeater and _command not in (RPTL, RPTK):
                 self._send_nak(repeater_id, addr, reason="Repeater not registered")
                 return
 
             # Update ping time for connected repeaters
             if repeater and repeater.connection_state == 'connected':
-                repeater.last_ping = time()
+                repeater.last_ping = self._now
                 # If missed_pings is being cleared, notify dashboard
                 if repeater.missed_pings > 0:
                     repeater.missed_pings = 0
@@ -1831,49 +1845,20 @@ class HBProtocol(asyncio.DatagramProtocol):
                     repeater.missed_pings = 0
 
             # Process the packet
-            if _command == DMRD:
-                self._handle_dmr_data(data, addr)
-            elif _command == RPTL:
-                LOGGER.debug(f'Received RPTL from {ip}:{port} - Repeater Login Request')
-                self._handle_repeater_login(repeater_id, addr)
-            elif len(data) == 4:  # Special case: raw repeater ID login
-                # Try to interpret as a raw repeater ID
-                LOGGER.debug(f'Received possible raw repeater ID login from {ip}:{port}')
-                self._handle_repeater_login(data, addr)
-            elif _command == RPTK:
-                LOGGER.debug(f'Received RPTK from {ip}:{port} - Authentication Response')
-                self._handle_auth_response(repeater_id, data[8:], addr)
-            elif _command == RPTC:
-                if data[:5] == RPTCL:
-                    LOGGER.debug(f'Received RPTCL from {ip}:{port} - Disconnect Request')
-                    self._handle_disconnect(repeater_id, addr)
-                else:
-                    LOGGER.debug(f'Received RPTC from {ip}:{port} - Configuration Data')
-                    self._handle_config(data, addr)
-            elif _command[:4] == RPTP:  # Check just RPTP prefix since that's enough to identify RPTPING
-                LOGGER.debug(f'Received RPTPING from {ip}:{port} - Repeater Keepalive')
-                self._handle_ping(repeater_id, addr)
-            elif _command == RPTO:
-                LOGGER.info(f'Received RPTO from {ip}:{port} - Options/TG Configuration')
-                self._handle_options(repeater_id, data[8:], addr)
-            elif _command == DMRA:
-                LOGGER.debug(f'Received DMRA from {ip}:{port} - DMR Talker Alias (packet length: {len(data)})')
-                if repeater_id:
-                    self._handle_talker_alias(repeater_id, data[8:], addr)
-                else:
-                    LOGGER.warning(f'DMRA packet from {ip}:{port} has no repeater_id - packet hex: {data[:20].hex()}')
-            else:
-                # Try to decode the command as ASCII for better logging
-                try:
-                    cmd_str = _command.decode('utf-8', errors='replace')
-                except:
-                    cmd_str = _command.hex()
-                LOGGER.warning(f'Unknown command received from {ip}:{port}: {cmd_str} (hex: {_command.hex()})')
+            _, payload_start, handler_name, description = entry
+            if description:
+                LOGGER.debug('Received %s from %s:%s', description, ip, port)
+            getattr(self, handler_name)(repeater_id, data[payload_start:], addr)
         except Exception as e:
-            LOGGER.error(f'Error processing datagram from {ip}:{port}: {str(e)}')
+            LOGGER.error('Error processing datagram from %s:%s: %s', ip, port, e)
 
     def _validate_repeater(self, repeater_id: bytes, addr: PeerAddress) -> Optional[RepeaterState]:
         """Validate repeater state and address"""
+        # Fast path: IPv4 transports deliver (ip, port), which is the index key
+        repeater = self._by_addr.get(addr)
+        if repeater is not None and repeater.repeater_id == repeater_id:
+            return repeater
+
         if repeater_id not in self._repeaters:
             # Per-packet logging - only enable for heavy troubleshooting
             #LOGGER.debug(f'Repeater {rid_to_int(repeater_id)} not found in _repeaters dict')
@@ -1885,8 +1870,8 @@ class HBProtocol(asyncio.DatagramProtocol):
         #LOGGER.debug(f'Validating repeater {rid_to_int(repeater_id)}: state="{repeater.connection_state}", stored_addr={repeater.sockaddr}, incoming_addr={addr}')
         
         if not self._addr_matches_repeater(repeater, addr):
-            LOGGER.warning(f'Message from wrong IP for repeater {rid_to_int(repeater_id)}')
-            self._send_nak(repeater_id, addr, reason="Message from incorrect IP address")
+            LOGGER.warning('Message from wrong IP for repeater %d', repeater.repeater_id_int)
+            self._send_nak(repeater_id, addr, reason="Message from incorrect IP address", repeater=repeater)
             return None
             
         return repeater
@@ -1998,7 +1983,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         # (APRS, SMS, GPS, CSBK) from real voice. Data calls are logged but
         # never forwarded.
         if classify_stream_kind(frame_type, dtype_vseq) == STREAM_KIND_DATA:
-            rid_int = rid_to_int(repeater.repeater_id)
+            rid_int = repeater.repeater_id_int
             new_stream = self._handle_data_stream(
                 source_key=f'repeater {rid_int}',
                 owner_id=repeater.repeater_id,
@@ -2010,6 +1995,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 cache_outbound_name=None,
             )
             repeater.set_slot_stream(slot, new_stream)
+            self._live_repeater_slots.add((repeater.repeater_id, slot))
             emit_call_type = 'private' if call_type_bit == 1 else 'group'
             self._emit_stream_start(
                 'repeater', rid_int, slot, rf_src, dst_id, stream_id,
@@ -2024,7 +2010,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             return self._handle_unit_stream_start(repeater, rf_src, dst_id, slot, stream_id)
         
         current_stream = repeater.get_slot_stream(slot)
-        current_time = time()
+        current_time = self._now
         fast_tg_switch = False  # Track if this is a fast talkgroup switch
         
         # Check if there's already an active stream on this slot
@@ -2038,9 +2024,9 @@ class HBProtocol(asyncio.DatagramProtocol):
             # Remove this repeater from any active route-caches to stop wasting bandwidth.
             # Note: Ended assumed streams should go through normal hang time logic instead.
             if current_stream.is_assumed and not current_stream.ended:
-                LOGGER.info(f'Repeater {rid_to_int(repeater.repeater_id)} slot {slot} '
-                           f'starting RX while we have active assumed TX stream - repeater wins, '
-                           f'removing from active route-caches')
+                LOGGER.info('Repeater %d slot %d starting RX while we have active assumed TX stream - '
+                            'repeater wins, removing from active route-caches',
+                            repeater.repeater_id_int, slot)
                 
                 # Remove this repeater from all active stream route-caches
                 for other_repeater in self._repeaters.values():
@@ -2051,9 +2037,8 @@ class HBProtocol(asyncio.DatagramProtocol):
                             other_stream.target_repeaters and
                             repeater.repeater_id in other_stream.target_repeaters):
                             other_stream.target_repeaters.discard(repeater.repeater_id)
-                            LOGGER.debug(f'Removed repeater {rid_to_int(repeater.repeater_id)} '
-                                       f'from route-cache of stream on repeater '
-                                       f'{rid_to_int(other_repeater.repeater_id)} slot {other_slot}')
+                            LOGGER.debug('Removed repeater %d from route-cache of stream on repeater %d slot %d',
+                                         repeater.repeater_id_int, other_repeater.repeater_id_int, other_slot)
                 
                 # Clear the assumed stream - real stream takes precedence
                 # Fall through to create new real stream
@@ -2078,27 +2063,27 @@ class HBProtocol(asyncio.DatagramProtocol):
 
                 if current_stream.rf_src == rf_src:
                     if current_stream.dst_id == dst_id:
-                        LOGGER.info(f'Same user continuing conversation on repeater {rid_to_int(repeater.repeater_id)} '
-                                   f'{new_ts_tg} src={bytes_to_int(rf_src)} during hang time')
+                        LOGGER.info('Same user continuing conversation on repeater %d %s src=%d during hang time',
+                                    repeater.repeater_id_int, new_ts_tg, current_stream.rf_src_int)
                     else:
                         old_ts_tg = fmt_ts_tg(cur_net[0], cur_net[1], current_stream.slot, current_stream.dst_id)
-                        LOGGER.info(f'Same user switching talkgroup on repeater {rid_to_int(repeater.repeater_id)} '
-                                   f'during hang time: src={bytes_to_int(rf_src)} '
-                                   f'old {old_ts_tg} → new {new_ts_tg}')
+                        LOGGER.info('Same user switching talkgroup on repeater %d during hang time: '
+                                    'src=%d old %s → new %s',
+                                    repeater.repeater_id_int, current_stream.rf_src_int, old_ts_tg, new_ts_tg)
                         fast_tg_switch = True  # Mark as fast talkgroup switch
                     # Allow by falling through to create new stream
                 # Different user - check if same talkgroup
                 elif current_stream.dst_id == dst_id:
-                    LOGGER.info(f'Different user joining conversation on repeater {rid_to_int(repeater.repeater_id)} '
-                               f'{new_ts_tg} during hang time: '
-                               f'old_src={bytes_to_int(current_stream.rf_src)} new_src={bytes_to_int(rf_src)}')
+                    LOGGER.info('Different user joining conversation on repeater %d %s during hang time: '
+                                'old_src=%d new_src=%d',
+                                repeater.repeater_id_int, new_ts_tg, current_stream.rf_src_int, bytes_to_int(rf_src))
                     # Allow by falling through to create new stream
                 else:
                     # Different user AND different talkgroup = hijacking attempt
                     old_ts_tg = fmt_ts_tg(cur_net[0], cur_net[1], current_stream.slot, current_stream.dst_id)
-                    LOGGER.warning(f'Hang time hijacking blocked on repeater {rid_to_int(repeater.repeater_id)}: '
-                                  f'slot reserved for {old_ts_tg}, '
-                                  f'denied src={bytes_to_int(rf_src)} attempting {new_ts_tg}')
+                    LOGGER.warning('Hang time hijacking blocked on repeater %d: slot reserved for %s, '
+                                   'denied src=%d attempting %s',
+                                   repeater.repeater_id_int, old_ts_tg, bytes_to_int(rf_src), new_ts_tg)
                     return False
             else:
                 # Active stream - different stream_id means contention
@@ -2111,18 +2096,17 @@ class HBProtocol(asyncio.DatagramProtocol):
                     new_net = (slot, dst_id)
                 cur_ts_tg = fmt_ts_tg(cur_net[0], cur_net[1], current_stream.slot, current_stream.dst_id)
                 new_ts_tg = fmt_ts_tg(new_net[0], new_net[1], slot, dst_id)
-                LOGGER.warning(f'Stream contention on repeater {rid_to_int(repeater.repeater_id)}: '
-                              f'existing {cur_ts_tg} src={bytes_to_int(current_stream.rf_src)} '
-                              f'vs new {new_ts_tg} src={bytes_to_int(rf_src)}')
+                LOGGER.warning('Stream contention on repeater %d: existing %s src=%d vs new %s src=%d',
+                               repeater.repeater_id_int, cur_ts_tg, current_stream.rf_src_int,
+                               new_ts_tg, bytes_to_int(rf_src))
 
                 # Deny the new stream - first come, first served
                 return False
         
         # Check if this repeater is allowed to send traffic on this TS/TGID (inbound routing)
-        if not self._check_inbound_routing(repeater.repeater_id, slot, dst_id):
+        if not self._check_inbound_routing(repeater, slot, dst_id):
             # Track denied streams to avoid logging every packet
             denial_key = (repeater.repeater_id, slot, stream_id)
-            current_time = time()
             
             # Only log if this is the first packet of this denied stream
             if denial_key not in self._denied_streams:
@@ -2134,10 +2118,10 @@ class HBProtocol(asyncio.DatagramProtocol):
                         and (slot, dst_id) not in repeater.inbound_map):
                     rf_slot_d, rf_dst_d = repeater.outbound_map[(slot, dst_id)]
                     LOGGER.warning(
-                        f'Inbound rejected: repeater={rid_to_int(repeater.repeater_id)} '
-                        f'keyed net-side TS{slot}/TG{int.from_bytes(dst_id, "big")} '
-                        f'for a translated TG — local side is '
-                        f'TS{rf_slot_d}/TG{int.from_bytes(rf_dst_d, "big")}'
+                        'Inbound rejected: repeater=%d keyed net-side TS%d/TG%d '
+                        'for a translated TG — local side is TS%d/TG%d',
+                        repeater.repeater_id_int, slot, bytes_to_int(dst_id),
+                        rf_slot_d, bytes_to_int(rf_dst_d)
                     )
                 else:
                     # ACL check ran against net-side vocabulary — show that
@@ -2151,8 +2135,8 @@ class HBProtocol(asyncio.DatagramProtocol):
                     allowed_tgids = repeater.slot1_talkgroups if net_slot_d == 1 else repeater.slot2_talkgroups
                     allowed_display = sorted(int.from_bytes(tg, 'big') for tg in allowed_tgids) if allowed_tgids else []
                     ts_tg = fmt_ts_tg(net_slot_d, net_dst_d, slot, dst_id)
-                    LOGGER.warning(f'Inbound routing denied: repeater={rid_to_int(repeater.repeater_id)} '
-                                  f'{ts_tg} not in allowed list {allowed_display}')
+                    LOGGER.warning('Inbound routing denied: repeater=%d %s not in allowed list %s',
+                                   repeater.repeater_id_int, ts_tg, allowed_display)
 
                 # Add to denied cache
                 self._denied_streams[denial_key] = current_time
@@ -2190,20 +2174,22 @@ class HBProtocol(asyncio.DatagramProtocol):
         )
         
         repeater.set_slot_stream(slot, new_stream)
+        self._live_repeater_slots.add((repeater.repeater_id, slot))
         
         # Log stream start with fast talkgroup switch indicator and target count
-        ts_tg = fmt_ts_tg(net_slot, net_dst_id, slot, dst_id)
-        fast_tag = ' [FAST TG SWITCH]' if fast_tg_switch else ''
-        LOGGER.info(
-            f'Group RX stream started on repeater {rid_to_int(repeater.repeater_id)} {ts_tg} '
-            f'src={bytes_to_int(rf_src)} targets={len(target_repeaters)} '
-            f'stream_id={stream_id.hex()}{fast_tag}'
-        )
+        if LOGGER.isEnabledFor(logging.INFO):
+            ts_tg = fmt_ts_tg(net_slot, net_dst_id, slot, dst_id)
+            fast_tag = ' [FAST TG SWITCH]' if fast_tg_switch else ''
+            LOGGER.info(
+                'Group RX stream started on repeater %d %s src=%d targets=%d stream_id=%s%s',
+                repeater.repeater_id_int, ts_tg, new_stream.rf_src_int,
+                len(target_repeaters), new_stream.stream_id_hex, fast_tag
+            )
         
         # Emit stream_start event
         self._emit_stream_start(
             'repeater', 
-            int.from_bytes(repeater.repeater_id, 'big'),
+            repeater.repeater_id_int,
             slot,
             rf_src,
             dst_id, 
@@ -2214,15 +2200,12 @@ class HBProtocol(asyncio.DatagramProtocol):
         
         # Update user cache (for "last heard" and private call routing)
         if self._user_cache:
-            src_id = int.from_bytes(rf_src, 'big')
-            repeater_id = int.from_bytes(repeater.repeater_id, 'big')
-            dst = int.from_bytes(dst_id, 'big')
             self._user_cache.update(
-                radio_id=src_id,
-                repeater_id=repeater_id,
+                radio_id=new_stream.rf_src_int,
+                repeater_id=repeater.repeater_id_int,
                 callsign='',  # Callsign lookup handled by dashboard
                 slot=slot,
-                talkgroup=dst
+                talkgroup=new_stream.dst_id_int
             )
 
         return True
@@ -2250,7 +2233,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         Returns True if the stream was accepted and routing cached, False to
         reject the call.
         """
-        rid_int = rid_to_int(repeater.repeater_id)
+        rid_int = repeater.repeater_id_int
         src_int = bytes_to_int(rf_src)
         dst_int = bytes_to_int(dst_id)
 
@@ -2264,7 +2247,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             return False
 
         current_stream = repeater.get_slot_stream(slot)
-        current_time = time()
+        current_time = self._now
 
         if current_stream:
             # Same stream continuing
@@ -2286,8 +2269,8 @@ class HBProtocol(asyncio.DatagramProtocol):
                     if not (same_pair or same_src):
                         LOGGER.warning(
                             f'UNIT CALL hang-time hijack blocked on repeater {rid_int} TS{slot}: '
-                            f'slot reserved for {bytes_to_int(current_stream.rf_src)}↔'
-                            f'{bytes_to_int(current_stream.dst_id)}, '
+                            f'slot reserved for {current_stream.rf_src_int}↔'
+                            f'{current_stream.dst_id_int}, '
                             f'denied src={src_int} → dst={dst_int}'
                         )
                         return False
@@ -2304,7 +2287,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 # Active stream on this slot — contention, first come wins.
                 LOGGER.warning(
                     f'UNIT CALL contention on repeater {rid_int} TS{slot}: '
-                    f'existing stream_id={current_stream.stream_id.hex()} '
+                    f'existing stream_id={current_stream.stream_id_hex} '
                     f'vs new src={src_int} → dst={dst_int} stream_id={stream_id.hex()}'
                 )
                 return False
@@ -2330,6 +2313,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             is_broadcast_unit_call=is_broadcast,
         )
         repeater.set_slot_stream(slot, new_stream)
+        self._live_repeater_slots.add((repeater.repeater_id, slot))
 
         # Start-of-stream line mirrors the group-call format but with TS/RID in
         # place of TS/TGID and a mode annotation (one-to-one / broadcast /
@@ -2352,7 +2336,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         LOGGER.info(
             f'Unit RX stream started on repeater {rid_int} TS/RID: {slot}/{dst_int} '
             f'src={src_int} targets={len(target_repeaters)} '
-            f'stream_id={stream_id.hex()} {mode_tag}'
+            f'stream_id={new_stream.stream_id_hex} {mode_tag}'
         )
 
         self._emit_stream_start(
@@ -2514,24 +2498,27 @@ class HBProtocol(asyncio.DatagramProtocol):
     def _handle_stream_packet(self, repeater: RepeaterState, rf_src: bytes, dst_id: bytes,
                               slot: int, stream_id: bytes, call_type_bit: int = 1,
                               frame_type: int = 0, dtype_vseq: int = 0,
-                              payload: bytes = b'') -> bool:
+                              payload: bytes = b'') -> Optional[StreamState]:
         """
         Handle a packet for an ongoing stream.
-        Returns True if the packet is valid for the current stream, False otherwise.
+        Returns the slot's stream this packet belongs to, or None if the packet
+        is dropped (contention or talkgroup not allowed).
         """
-        current_stream = repeater.get_slot_stream(slot)
+        # Per-packet paths index streams directly; slot always comes from the
+        # header bits or a validated translation map, so it is 1 or 2
+        current_stream = repeater.streams[slot - 1]
 
         if not current_stream:
             # No active stream - this is a new stream
-            return self._handle_stream_start(repeater, rf_src, dst_id, slot, stream_id,
-                                             call_type_bit, frame_type, dtype_vseq, payload)
+            return self._start_slot_stream(repeater, rf_src, dst_id, slot, stream_id,
+                                           call_type_bit, frame_type, dtype_vseq, payload)
 
         # Check if this packet belongs to the current stream
         if current_stream.stream_id != stream_id:
             # Different stream - potential contention
             # But check if old stream is stale (>200ms since last packet)
             # This provides fast terminator detection when operators key up quickly
-            current_time = time()
+            current_time = self._now
             time_since_last_packet = current_time - current_stream.last_seen
 
             # Only use fast terminator for active streams that never got a proper terminator
@@ -2542,43 +2529,53 @@ class HBProtocol(asyncio.DatagramProtocol):
                 # expected to be single-burst so quiet their fast-terminator
                 # log noise down to DEBUG.
                 log_fn = LOGGER.debug if current_stream.call_type == 'data' else LOGGER.info
-                log_fn(f'Fast terminator: stream on repeater {int.from_bytes(repeater.repeater_id, "big")} slot {slot} '
-                           f'ended via inactivity ({time_since_last_packet*1000:.0f}ms since last packet): '
-                           f'src={int.from_bytes(current_stream.rf_src, "big")}, '
-                           f'dst={int.from_bytes(current_stream.dst_id, "big")}, '
-                           f'duration={(current_time - current_stream.start_time):.2f}s, packets={current_stream.packet_count}')
+                log_fn('Fast terminator: stream on repeater %d slot %d ended via inactivity '
+                       '(%.0fms since last packet): src=%d, dst=%d, duration=%.2fs, packets=%d',
+                       repeater.repeater_id_int, slot, time_since_last_packet * 1000,
+                       current_stream.rf_src_int, current_stream.dst_id_int,
+                       current_time - current_stream.start_time, current_stream.packet_count)
 
                 # Now use unified ending logic
                 self._end_stream(current_stream, repeater.repeater_id, slot, current_time, 'fast_terminator')
 
                 # Don't clear the stream - let _handle_stream_start check hang time
                 # It will create the new stream and replace this one if allowed
-                return self._handle_stream_start(repeater, rf_src, dst_id, slot, stream_id,
-                                                 call_type_bit, frame_type, dtype_vseq, payload)
+                return self._start_slot_stream(repeater, rf_src, dst_id, slot, stream_id,
+                                               call_type_bit, frame_type, dtype_vseq, payload)
             elif not current_stream.ended:
                 # Real contention - stream still active (within 200ms).
                 # Data streams routinely arrive as back-to-back bursts with
                 # fresh stream_ids; suppress contention warning for those and
                 # silently accept (logged at stream-start dedupe window).
                 if current_stream.call_type == 'data':
-                    return False
-                LOGGER.warning(f'Stream contention on repeater {int.from_bytes(repeater.repeater_id, "big")} slot {slot}: '
-                              f'existing stream (src={int.from_bytes(current_stream.rf_src, "big")}, '
-                              f'dst={int.from_bytes(current_stream.dst_id, "big")}, '
-                              f'active {time_since_last_packet*1000:.0f}ms ago) '
-                              f'vs new stream (src={int.from_bytes(rf_src, "big")}, '
-                              f'dst={int.from_bytes(dst_id, "big")})')
-                return False
+                    return None
+                LOGGER.warning('Stream contention on repeater %d slot %d: existing stream '
+                               '(src=%d, dst=%d, active %.0fms ago) vs new stream (src=%d, dst=%d)',
+                               repeater.repeater_id_int, slot,
+                               current_stream.rf_src_int, current_stream.dst_id_int,
+                               time_since_last_packet * 1000,
+                               bytes_to_int(rf_src), bytes_to_int(dst_id))
+                return None
             else:
                 # Stream already ended (in hang time) - let _handle_stream_start check hang time rules
-                return self._handle_stream_start(repeater, rf_src, dst_id, slot, stream_id,
-                                                 call_type_bit, frame_type, dtype_vseq, payload)
+                return self._start_slot_stream(repeater, rf_src, dst_id, slot, stream_id,
+                                               call_type_bit, frame_type, dtype_vseq, payload)
         
         # Update stream state
-        current_stream.last_seen = time()
+        current_stream.last_seen = self._now
         current_stream.packet_count += 1
         
-        return True
+        return current_stream
+
+    def _start_slot_stream(self, repeater: RepeaterState, rf_src: bytes, dst_id: bytes,
+                           slot: int, stream_id: bytes, call_type_bit: int,
+                           frame_type: int, dtype_vseq: int,
+                           payload: bytes) -> Optional[StreamState]:
+        """Run _handle_stream_start and return the stream it installed, or None if denied"""
+        if not self._handle_stream_start(repeater, rf_src, dst_id, slot, stream_id,
+                                         call_type_bit, frame_type, dtype_vseq, payload):
+            return None
+        return repeater.get_slot_stream(slot)
         
     # ========== INBOUND REPEATER MANAGEMENT ==========
         
@@ -2596,17 +2593,19 @@ class HBProtocol(asyncio.DatagramProtocol):
             # Emit event before removing so dashboard can update
             self._events.emit('repeater_disconnected', {
                 'repeater_id': rid_to_int(repeater_id),
-                'callsign': repeater.callsign.decode().strip() if repeater.callsign else 'Unknown',
+                'callsign': repeater.get_callsign_str() if repeater.callsign else 'Unknown',
                 'reason': reason
             })
             
             # Remove from active repeaters
             del self._repeaters[repeater_id]
+            if self._by_addr.get(repeater.sockaddr) is repeater:
+                del self._by_addr[repeater.sockaddr]
             
             # No cache cleanup needed - using direct conversions to prevent memory leaks
             
 
-    def _handle_repeater_login(self, repeater_id: bytes, addr: PeerAddress) -> None:
+    def _handle_repeater_login(self, repeater_id: bytes, data: bytes, addr: PeerAddress) -> None:
         """Handle repeater login request"""
         # Handle both IPv4 (ip, port) and IPv6 (ip, port, flowinfo, scopeid) address formats
         ip = addr[0]
@@ -2631,7 +2630,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 old_addr = repeater.sockaddr
                 self._remove_repeater(repeater_id, "reconnect_different_port")
                 # Then send NAK to the old address to ensure cleanup
-                self._send_nak(repeater_id, old_addr, reason="Repeater reconnecting from new address")
+                self._send_nak(repeater_id, old_addr, reason="Repeater reconnecting from new address", repeater=repeater)
                 # Continue with new connection below
             else:
                 # Same repeater reconnecting from same IP:port
@@ -2639,15 +2638,14 @@ class HBProtocol(asyncio.DatagramProtocol):
                 LOGGER.info(f'Repeater {rid_to_int(repeater_id)} reconnecting while in state {old_state}')
                 # Preserve existing salt on login retry
                 if old_state == 'login':
-                    existing_salt = repeater.salt
-                    repeater = RepeaterState(repeater_id=repeater_id, ip=ip, port=port)
-                    repeater.salt = existing_salt  # Reuse same salt
+                    repeater = RepeaterState(repeater_id=repeater_id, ip=ip, port=port,
+                                             salt=repeater.salt)  # Reuse same salt
                     repeater.connection_state = 'login'
                     self._repeaters[repeater_id] = repeater
+                    self._by_addr[repeater.sockaddr] = repeater
                     
                     # Send login ACK with same salt
-                    salt_bytes = repeater.salt.to_bytes(4, 'big')
-                    self._send_packet(b''.join([RPTACK, salt_bytes]), addr)
+                    self._send_packet(RPTACK + repeater.salt_bytes, addr)
                     LOGGER.info(f'Repeater {rid_to_int(repeater_id)} login retry from {ip}:{port}, resending same salt: {repeater.salt}')
                     return
                 
@@ -2655,10 +2653,10 @@ class HBProtocol(asyncio.DatagramProtocol):
         repeater = RepeaterState(repeater_id=repeater_id, ip=ip, port=port)
         repeater.connection_state = 'login'
         self._repeaters[repeater_id] = repeater
+        self._by_addr[repeater.sockaddr] = repeater
         
         # Send login ACK with salt
-        salt_bytes = repeater.salt.to_bytes(4, 'big')
-        self._send_packet(b''.join([RPTACK, salt_bytes]), addr)
+        self._send_packet(RPTACK + repeater.salt_bytes, addr)
         LOGGER.info(f'Repeater {rid_to_int(repeater_id)} login request from {ip}:{port}, sent salt: {repeater.salt}')
 
     def _handle_auth_response(self, repeater_id: bytes, auth_hash: bytes, addr: PeerAddress) -> None:
@@ -2666,7 +2664,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         repeater = self._validate_repeater(repeater_id, addr)
         if not repeater or repeater.connection_state != 'login':
             LOGGER.warning(f'Auth response from repeater {rid_to_int(repeater_id)} in wrong state')
-            self._send_nak(repeater_id, addr)
+            self._send_nak(repeater_id, addr, repeater=repeater)
             return
             
         try:
@@ -2679,54 +2677,46 @@ class HBProtocol(asyncio.DatagramProtocol):
             # If no matching configuration found, reject the connection
             if repeater_config is None:
                 LOGGER.warning(f'Repeater {rid_to_int(repeater_id)} does not match any configured patterns and no default is set')
-                self._send_nak(repeater_id, addr, reason="No matching configuration")
+                self._send_nak(repeater_id, addr, reason="No matching configuration", repeater=repeater)
                 self._remove_repeater(repeater_id, "no_config_match")
                 return
             
             # Validate the hash
-            salt_bytes = repeater.salt.to_bytes(4, 'big')
-            calc_hash = bytes.fromhex(sha256(b''.join([salt_bytes, repeater_config.passphrase.encode()])).hexdigest())
+            calc_hash = sha256(repeater.salt_bytes + repeater_config.passphrase.encode()).digest()
             
-            if auth_hash == calc_hash:
+            if compare_digest(auth_hash, calc_hash):
                 repeater.authenticated = True
                 repeater.connection_state = 'config'
-                self._send_packet(b''.join([RPTACK, repeater_id]), addr)
+                self._send_packet(repeater.ack_packet, addr)
                 LOGGER.info(f'Repeater {rid_to_int(repeater_id)} authenticated successfully')
             else:
                 LOGGER.warning(f'Repeater {rid_to_int(repeater_id)} failed authentication')
-                self._send_nak(repeater_id, addr, reason="Authentication failed")
+                self._send_nak(repeater_id, addr, reason="Authentication failed", repeater=repeater)
                 self._remove_repeater(repeater_id, "auth_failed")
                 
         except Exception as e:
             LOGGER.error(f'Authentication error for repeater {rid_to_int(repeater_id)}: {str(e)}')
-            self._send_nak(repeater_id, addr)
+            self._send_nak(repeater_id, addr, repeater=repeater)
             self._remove_repeater(repeater_id, "auth_error")
 
-    def _handle_config(self, data: bytes, addr: PeerAddress) -> None:
+    def _handle_config(self, repeater_id: bytes, data: bytes, addr: PeerAddress) -> None:
         """Handle configuration from repeater"""
         try:
-            repeater_id = data[4:8]
             repeater = self._validate_repeater(repeater_id, addr)
             if not repeater or not repeater.authenticated or repeater.connection_state != 'config':
                 LOGGER.warning(f'Config from repeater {rid_to_int(repeater_id)} in wrong state')
-                self._send_nak(repeater_id, addr)
+                self._send_nak(repeater_id, addr, repeater=repeater)
                 return
                 
-            # Store raw bytes for metadata
-            repeater.callsign = data[8:16]
-            repeater.rx_freq = data[16:25]
-            repeater.tx_freq = data[25:34]
-            repeater.tx_power = data[34:36]
-            repeater.colorcode = data[36:38]
-            repeater.latitude = data[38:46]
-            repeater.longitude = data[46:55]
-            repeater.height = data[55:58]
-            repeater.location = data[58:78]
-            repeater.description = data[78:97]
-            repeater.slots = data[97:98]
-            repeater.url = data[98:222]
-            repeater.software_id = data[222:262]
-            repeater.package_id = data[262:302]
+            # Store raw bytes for metadata. Short packets are space-padded so
+            # missing trailing fields decode (and strip) to empty strings.
+            if len(data) < _RPTC_CONFIG_END:
+                data = data.ljust(_RPTC_CONFIG_END, b' ')
+            (repeater.callsign, repeater.rx_freq, repeater.tx_freq,
+             repeater.tx_power, repeater.colorcode, repeater.latitude,
+             repeater.longitude, repeater.height, repeater.location,
+             repeater.description, repeater.slots, repeater.url,
+             repeater.software_id, repeater.package_id) = _RPTC_CONFIG.unpack_from(data, 8)
             
             # Detect connection type from package_id (primary) and software_id (fallback)
             repeater.connection_type = detect_connection_type(
@@ -2734,16 +2724,17 @@ class HBProtocol(asyncio.DatagramProtocol):
             )
             
             # Log detailed configuration at debug level
-            LOGGER.debug(f'Repeater {rid_to_int(repeater_id)} config:'
-                      f'\n    Callsign: {repeater.callsign.decode().strip()}'
-                      f'\n    RX Freq: {repeater.rx_freq.decode().strip()}'
-                      f'\n    TX Freq: {repeater.tx_freq.decode().strip()}'
-                      f'\n    Power: {repeater.tx_power.decode().strip()}'
-                      f'\n    ColorCode: {repeater.colorcode.decode().strip()}'
-                      f'\n    Location: {repeater.location.decode().strip()}'
-                      f'\n    Software: {repeater.software_id.decode().strip()}'
-                      f'\n    Package: {repeater.package_id.decode().strip()}'
-                      f'\n    Type: {repeater.connection_type}')
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug(f'Repeater {repeater.repeater_id_int} config:'
+                          f'\n    Callsign: {repeater.get_callsign_str()}'
+                          f'\n    RX Freq: {repeater.rx_freq.decode().strip()}'
+                          f'\n    TX Freq: {repeater.tx_freq.decode().strip()}'
+                          f'\n    Power: {repeater.tx_power.decode().strip()}'
+                          f'\n    ColorCode: {repeater.colorcode.decode().strip()}'
+                          f'\n    Location: {repeater.location.decode().strip()}'
+                          f'\n    Software: {repeater.software_id.decode().strip()}'
+                          f'\n    Package: {repeater.package_id.decode().strip()}'
+                          f'\n    Type: {repeater.connection_type}')
 
             repeater.connected = True
             repeater.connection_state = 'connected'
@@ -2751,7 +2742,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             # Load and cache TG sets from config for fast routing checks
             self._load_repeater_tg_config(repeater_id, repeater)
             
-            self._send_packet(b''.join([RPTACK, repeater_id]), addr)
+            self._send_packet(repeater.ack_packet, addr)
             LOGGER.info(f'Repeater {rid_to_int(repeater_id)} ({repeater.get_callsign_str()}) configured successfully')
             LOGGER.debug(f'Repeater state after config: id={rid_to_int(repeater_id)}, state={repeater.connection_state}, addr={repeater.sockaddr}')
             
@@ -2763,8 +2754,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             
         except Exception as e:
             LOGGER.error(f'Error parsing config: {str(e)}')
-            if 'repeater_id' in locals():
-                self._send_nak(repeater_id, addr)
+            self._send_nak(repeater_id, addr)
 
     def _emit_repeater_details(self, repeater_id: bytes, repeater: RepeaterState) -> None:
         """
@@ -2996,13 +2986,16 @@ class HBProtocol(asyncio.DatagramProtocol):
         try:
             # Parse options string
             options_str = data.decode('utf-8', errors='ignore').strip('\x00').strip()
-            LOGGER.info(f'📋 OPTIONS from {rid_to_int(repeater_id)} ({repeater.callsign.decode().strip()}): {options_str}')
+            LOGGER.info(f'📋 OPTIONS from {repeater.repeater_id_int} ({repeater.get_callsign_str()}): {options_str}')
             
-            # Get original config TGs (these are the master allow list)
-            repeater_config = self._matcher.get_repeater_config(
-                rid_to_int(repeater_id),
-                repeater.callsign.decode().strip() if repeater.callsign else None
-            )
+            # Get original config TGs (these are the master allow list),
+            # reusing the config resolved when the repeater sent RPTC
+            repeater_config = repeater.repeater_config
+            if repeater_config is None:
+                repeater_config = self._matcher.get_repeater_config(
+                    rid_to_int(repeater_id),
+                    repeater.get_callsign_str() if repeater.callsign else None
+                )
             
             # Convert config to bytes sets, handling None (allow all) properly
             # None = allow all TGs, [] = deny all, [1,2,3] = specific TGs
@@ -3247,12 +3240,12 @@ class HBProtocol(asyncio.DatagramProtocol):
             })
             
             # Send ACK
-            self._send_packet(b''.join([RPTACK, repeater_id]), addr)
+            self._send_packet(repeater.ack_packet, addr)
             
         except Exception as e:
             LOGGER.error(f'Error processing RPTO from {rid_to_int(repeater_id)}: {e}')
             # Still send ACK to avoid retries
-            self._send_packet(b''.join([RPTACK, repeater_id]), addr)
+            self._send_packet(repeater.ack_packet, addr)
 
     def _handle_talker_alias(self, repeater_id: bytes, data: bytes, addr: PeerAddress) -> None:
         """
@@ -3277,26 +3270,28 @@ class HBProtocol(asyncio.DatagramProtocol):
             # Talker alias format: https://github.com/g4klx/MMDVMHost/wiki/Talker-Alias
             
             # Send ACK to confirm receipt
-            self._send_packet(b''.join([RPTACK, repeater_id]), addr)
+            self._send_packet(repeater.ack_packet, addr)
             
         except Exception as e:
             LOGGER.error(f'Error processing DMRA from {rid_to_int(repeater_id)}: {e}')
             # Still send ACK to avoid retries
-            self._send_packet(b''.join([RPTACK, repeater_id]), addr)
+            self._send_packet(repeater.ack_packet, addr)
 
-    def _handle_ping(self, repeater_id: bytes, addr: PeerAddress) -> None:
+    def _handle_ping(self, repeater_id: bytes, data: bytes, addr: PeerAddress) -> None:
         """Handle ping (RPTPING/RPTP) from the repeater as a keepalive."""
         repeater = self._validate_repeater(repeater_id, addr)
         if not repeater or repeater.connection_state != 'connected':
-            LOGGER.warning(f'Ping from repeater {rid_to_int(repeater_id)} in wrong state (state="{repeater.connection_state}" if repeater else "None")')
-            self._send_nak(repeater_id, addr, reason="Wrong connection state")
+            LOGGER.warning('Ping from repeater %d in wrong state (state=%s)',
+                           rid_to_int(repeater_id), repeater.connection_state if repeater else None)
+            self._send_nak(repeater_id, addr, reason="Wrong connection state", repeater=repeater)
             return
             
         # Update ping time and reset missed pings
-        repeater.last_ping = time()
+        repeater.last_ping = self._now
         had_missed_pings = repeater.missed_pings > 0
         if had_missed_pings:
-            LOGGER.info(f'Ping counter reset for repeater {rid_to_int(repeater_id)} after {repeater.missed_pings} missed pings')
+            LOGGER.info('Ping counter reset for repeater %d after %d missed pings',
+                        repeater.repeater_id_int, repeater.missed_pings)
         repeater.missed_pings = 0
         repeater.ping_count += 1
         
@@ -3305,10 +3300,10 @@ class HBProtocol(asyncio.DatagramProtocol):
             self._events.emit('repeater_connected', self._prepare_repeater_event_data(repeater_id, repeater))
         
         # Send MSTPONG in response to RPTPING/RPTP from repeater
-        LOGGER.debug(f'Sending MSTPONG to repeater {rid_to_int(repeater_id)}')
-        self._send_packet(b''.join([MSTPONG, repeater_id]), addr)
+        LOGGER.debug('Sending MSTPONG to repeater %d', repeater.repeater_id_int)
+        self._send_packet(repeater.pong_packet, addr)
 
-    def _handle_disconnect(self, repeater_id: bytes, addr: PeerAddress) -> None:
+    def _handle_disconnect(self, repeater_id: bytes, data: bytes, addr: PeerAddress) -> None:
         """Handle repeater disconnect"""
         repeater = self._validate_repeater(repeater_id, addr)
         if repeater:
@@ -3320,7 +3315,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         repeater = self._validate_repeater(repeater_id, addr)
         if repeater:
             LOGGER.debug(f'Status report from repeater {rid_to_int(repeater_id)}: {data[8:].hex()}')
-            self._send_packet(b''.join([RPTACK, repeater_id]), addr)
+            self._send_packet(repeater.ack_packet, addr)
 
     def _is_dmr_terminator(self, data: bytes, frame_type: int) -> bool:
         """DMR terminator detection - delegated to protocol module"""
@@ -3365,7 +3360,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 continue
 
             # Check outbound routing (TG allowed on this repeater/slot, network vocab)
-            if not self._check_outbound_routing(target_repeater_id, slot, dst_id):
+            if not self._check_outbound_routing(target_repeater, slot, dst_id):
                 continue
 
             # Resolve the target's LOCAL slot/tgid for busy/hang-time checks.
@@ -3491,7 +3486,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             source_repeater = self._repeaters.get(source)
             if not source_repeater:
                 return
-            source_stream = source_repeater.get_slot_stream(slot)
+            source_stream = source_repeater.streams[slot - 1]
             src_inbound_map = source_repeater.inbound_map
             src_tx_override = source_repeater.tx_src_override
             source_disp_id = int.from_bytes(source, 'big')
@@ -3499,7 +3494,7 @@ class HBProtocol(asyncio.DatagramProtocol):
 
         if not source_stream or source_stream.stream_id != stream_id:
             # This shouldn't happen, but safety check
-            LOGGER.warning(f'Forwarding called but no matching stream found')
+            LOGGER.warning('Forwarding called but no matching stream found')
             return
 
         # Translate source-local → network ONCE. All target lookups use network
@@ -3522,17 +3517,14 @@ class HBProtocol(asyncio.DatagramProtocol):
         # Use cached target list (calculated once on stream start!)
         if not source_stream.routing_cached or source_stream.target_repeaters is None:
             # Safety fallback (shouldn't happen)
-            LOGGER.warning(f'Stream routing not cached, recalculating')
+            LOGGER.warning('Stream routing not cached, recalculating')
             source_stream.target_repeaters = self._calculate_stream_targets(
                 source, net_slot, net_dst_id, stream_id, net_rf_src
             )
             source_stream.routing_cached = True
 
         # Check if this is a terminator packet (use original data bits for check)
-        _bits = data[15]
-        _frame_type = (_bits & 0x30) >> 4
-        _dtype_vseq = _bits & 0xF
-        is_terminator = self._is_dmr_terminator(data, _frame_type)
+        _, _, _frame_type, _dtype_vseq, is_terminator = _BITS_DECODE[data[15]]
 
         # Does this frame carry an LC we need to rewrite under translation?
         # Only VHEAD/VTERM (full LC) and voice bursts B/C/D/E (EMB_LC) do.
@@ -3681,10 +3673,10 @@ class HBProtocol(asyncio.DatagramProtocol):
                         and not source_translated
                         and (out_slot, out_dst) == (slot, dst_id)
                         and net_rf_src == rf_src):
-                    self._send_packet(data, target_repeater.sockaddr)
+                    self._sendto(data, target_repeater.sockaddr)
                 else:
                     packet = build_target_packet(out_slot, out_dst, net_rf_src, None)
-                    self._send_packet(packet, target_repeater.sockaddr)
+                    self._sendto(packet, target_repeater.sockaddr)
 
                 # Track assumed stream state on target repeater using target-local values
                 self._update_assumed_stream(target_repeater, out_slot, net_rf_src, out_dst,
@@ -3703,51 +3695,39 @@ class HBProtocol(asyncio.DatagramProtocol):
     
 # _safe_decode_bytes moved to utils.py
 
-    def _handle_dmr_data(self, data: bytes, addr: PeerAddress) -> None:
+    def _handle_dmr_data(self, repeater_id: bytes, data: bytes, addr: PeerAddress) -> None:
         """Handle DMR data"""
-        # Parse packet using unified parser
-        packet = self._parse_dmr_packet(data)
-        if not packet:
-            LOGGER.warning(f'Invalid DMR data packet from {addr[0]}:{addr[1]} - length {len(data)} < 55')
+        if len(data) < _DMRD_MIN_LEN:
+            LOGGER.warning('Invalid DMR data packet from %s:%s - length %d < %d',
+                           addr[0], addr[1], len(data), _DMRD_MIN_LEN)
             return
             
-        repeater_id = packet['repeater_id']
         repeater = self._validate_repeater(repeater_id, addr)
         if not repeater or repeater.connection_state != 'connected':
-            LOGGER.warning(f'DMR data from repeater {packet["repeater_id_int"]} in wrong state')
+            LOGGER.warning('DMR data from repeater %d in wrong state', rid_to_int(repeater_id))
             return
             
-        # Extract fields from parsed packet
-        _seq = packet['seq']
-        _rf_src = packet['rf_src']
-        _dst_id = packet['dst_id']
-        _slot = packet['slot']
-        _call_type = packet['call_type']
-        _frame_type = packet['frame_type']
-        _stream_id = packet['stream_id']
-        _dtype_vseq = data[15] & 0x0F
-        _payload = data[20:53] if len(data) >= 53 else b''
-
-        # Check if this is a stream terminator (immediate end detection)
-        # Note: _is_dmr_terminator() checks packet header flags for immediate detection
-        _is_terminator = self._is_dmr_terminator(data, _frame_type)
+        # Extract header fields in one pass
+        _seq, _rf_src, _dst_id, _bits, _stream_id = _DMRD_HEADER.unpack_from(data)
+        # Terminator flag comes from the header bits (immediate end detection)
+        _slot, _call_type, _frame_type, _dtype_vseq, _is_terminator = _BITS_DECODE[_bits]
+        _payload = data[20:53]
 
         # Handle stream tracking
-        stream_valid = self._handle_stream_packet(
+        current_stream = self._handle_stream_packet(
             repeater, _rf_src, _dst_id, _slot, _stream_id, _call_type,
             _frame_type, _dtype_vseq, _payload,
         )
 
-        if not stream_valid:
+        if current_stream is None:
             # Stream contention or not allowed - drop packet silently
-            LOGGER.debug(f'Dropped packet from repeater {rid_to_int(repeater_id)} slot {_slot}: '
-                        f'src={int.from_bytes(_rf_src, "big")}, dst={int.from_bytes(_dst_id, "big")}, '
-                        f'reason=stream contention or talkgroup not allowed')
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug('Dropped packet from repeater %d slot %d: src=%d, dst=%d, '
+                             'reason=stream contention or talkgroup not allowed',
+                             repeater.repeater_id_int, _slot,
+                             int.from_bytes(_rf_src, 'big'), int.from_bytes(_dst_id, 'big'))
             return
 
-        # Get the current stream for this slot (after _handle_stream_packet has updated it)
-        current_stream = repeater.get_slot_stream(_slot)
-
         # Data streams are tracked (so fast-terminator/contention logic stays
         # quiet) and emitted to the dashboard, but never forwarded. Drop here
         # before the forwarding path and before stream_update telemetry —
@@ -3755,35 +3735,22 @@ class HBProtocol(asyncio.DatagramProtocol):
         if current_stream and current_stream.call_type == 'data':
             return
         
-        # Per-packet logging - only enable for heavy troubleshooting
-        #LOGGER.debug(f'DMR data from {packet["repeater_id_int"]} slot {_slot}: '
-        #            f'seq={_seq}, src={packet["src_id_int"]}, '
-        #            f'dst={packet["dst_id_int"]}, '
-        #            f'stream_id={_stream_id.hex()}, '
-        #            f'frame_type={_frame_type}, '
-        #            f'terminator={_is_terminator}, '
-        #            f'packet_count={current_stream.packet_count if current_stream else 0}, '
-        #            f'has_lc={current_stream.lc is not None if current_stream else False}')
-        
         # Handle terminator frame for immediate stream end detection
         if _is_terminator and current_stream and not current_stream.ended:
-            self._end_stream(current_stream, repeater_id, _slot, time(), 'terminator')
+            self._end_stream(current_stream, repeater_id, _slot, self._now, 'terminator')
         
         # Emit stream_update every 60 packets (10 superframes = 1 second)
         if current_stream and not current_stream.ended and current_stream.packet_count % 60 == 0:
             self._events.emit('stream_update', {
-                'repeater_id': rid_to_int(repeater_id),
+                'repeater_id': repeater.repeater_id_int,
                 'slot': _slot,
-                'src_id': int.from_bytes(current_stream.rf_src, 'big'),
-                'dst_id': int.from_bytes(current_stream.dst_id, 'big'),
-                'duration': round(time() - current_stream.start_time, 2),
+                'src_id': current_stream.rf_src_int,
+                'dst_id': current_stream.dst_id_int,
+                'duration': round(self._now - current_stream.start_time, 2),
                 'packets': current_stream.packet_count,
                 'call_type': current_stream.call_type
             })
         
-        # Stream end detection: terminator (primary) or timeout (fallback)
-        # Hang time prevents slot hijacking during conversations
-        
         # Forward DMR data to other connected repeaters
         self._forward_stream(data, repeater_id, _slot, _rf_src, _dst_id, _stream_id)
 
@@ -3812,8 +3779,8 @@ class HBProtocol(asyncio.DatagramProtocol):
                 hang-time semantics (subscriber pair) if a new stream arrives
                 on this slot after the assumed one ends.
         """
-        current_stream = repeater.get_slot_stream(slot)
-        current_time = time()
+        current_stream = repeater.streams[slot - 1]
+        current_time = self._now
 
         if not current_stream or current_stream.stream_id != stream_id:
             # New assumed stream starting
@@ -3832,26 +3799,27 @@ class HBProtocol(asyncio.DatagramProtocol):
                 is_unit_call=is_unit_call,
             )
             repeater.set_slot_stream(slot, new_stream)
+            self._live_repeater_slots.add((repeater.repeater_id, slot))
 
-            # Log at DEBUG level - TX streams are noisy
-            if is_unit_call:
-                ts_addr = f'TS/RID: {slot}/{bytes_to_int(dst_id)}'
-                call_type_prefix = 'Unit'
-            else:
-                ts_addr = fmt_ts_tg(net_slot if net_slot is not None else slot,
-                                    net_dst_id if net_dst_id is not None else dst_id,
-                                    slot, dst_id)
-                call_type_prefix = 'Group'
-            LOGGER.debug(
-                f'{call_type_prefix} TX stream started on repeater {rid_to_int(repeater.repeater_id)} '
-                f'{ts_addr} from repeater {source_repeater_id} src={bytes_to_int(rf_src)}'
-            )
+            # Log at DEBUG level - TX streams are noisy (one per target per stream)
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                if is_unit_call:
+                    ts_addr = f'TS/RID: {slot}/{new_stream.dst_id_int}'
+                    call_type_prefix = 'Unit'
+                else:
+                    ts_addr = fmt_ts_tg(net_slot if net_slot is not None else slot,
+                                        net_dst_id if net_dst_id is not None else dst_id,
+                                        slot, dst_id)
+                    call_type_prefix = 'Group'
+                LOGGER.debug('%s TX stream started on repeater %d %s from repeater %s src=%d',
+                             call_type_prefix, repeater.repeater_id_int, ts_addr,
+                             source_repeater_id, new_stream.rf_src_int)
 
             # Emit stream_start event for repeater card display (but marked as assumed)
             # Dashboard will filter these from Recent Events log
             self._emit_stream_start(
                 'repeater',
-                int.from_bytes(repeater.repeater_id, 'big'),
+                repeater.repeater_id_int,
                 slot,
                 rf_src,
                 dst_id,
@@ -3890,8 +3858,8 @@ class HBProtocol(asyncio.DatagramProtocol):
             is_terminator: Whether this packet is a terminator
             source_repeater_id: ID of source repeater (for logging)
         """
-        current_stream = outbound.get_slot_stream(slot)
-        current_time = time()
+        current_stream = outbound.streams[slot - 1]
+        current_time = self._now
         
         if not current_stream or current_stream.stream_id != stream_id:
             # New assumed stream starting on this outbound timeslot
@@ -3913,6 +3881,7 @@ class HBProtocol(asyncio.DatagramProtocol):
                 is_unit_call=is_unit_call,
             )
             outbound.set_slot_stream(slot, new_stream)
+            self._live_outbound_slots.add((outbound.config.name, slot))
 
             # Emit stream_start event for dashboard (using outbound connection name as identifier)
             # Keep structure minimal and JSON-serializable (match repeater-style fields
@@ -3963,7 +3932,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         the OBP ingress emit and deliberately does NOT touch _active_calls,
         matching ingress (OBP streams are not counted toward the active total).
         """
-        current_time = time()
+        current_time = self._now
         stream = obp.streams.get(stream_id)
         if stream is None:
             call_type = "private" if is_unit_call else "group"
@@ -3984,7 +3953,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             LOGGER.info(f'[OBP {obp.config.name}] TX stream start '
                         f'src={int.from_bytes(rf_src, "big")} '
                         f'tgid={int.from_bytes(dst_id, "big")} -> TS{slot} '
-                        f'stream_id={stream_id.hex()}')
+                        f'stream_id={stream.stream_id_hex}')
             self._emit_stream_start(
                 'openbridge',
                 obp.config.name,
@@ -4003,7 +3972,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             stream.ended = True
             stream.end_time = current_time
             LOGGER.info(f'[OBP {obp.config.name}] TX stream end '
-                        f'stream_id={stream_id.hex()} packets={stream.packet_count}')
+                        f'stream_id={stream.stream_id_hex} packets={stream.packet_count}')
             self._emit_stream_end('openbridge', obp.config.name, slot, stream, 'terminator')
 
 
@@ -4062,6 +4031,7 @@ class HBProtocol(asyncio.DatagramProtocol):
 
     def _handle_openbridge_packet(self, obp_name: str, packet: bytes, addr: tuple) -> None:
         """Authenticate, filter, and (TODO: route) an inbound OBP frame."""
+        self._now = time()
         state = self._openbridges.get(obp_name)
         if state is None:
             return
@@ -4075,7 +4045,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         calc = hmac_new(self._obp_key(cfg.passphrase), dmrd, sha1).digest()
         # Auth: HMAC must match AND the source socket must be the configured peer.
         if not compare_digest(rx_hmac, calc) or (addr[0], addr[1]) != (state.ip, state.port):
-            LOGGER.debug(f'[OBP {obp_name}] frame discarded (HMAC or source mismatch)')
+            LOGGER.debug('[OBP %s] frame discarded (HMAC or source mismatch)', obp_name)
             return
 
         dst_id = dmrd[8:11]                 # canonical TGID (wire == canonical)
@@ -4096,9 +4066,8 @@ class HBProtocol(asyncio.DatagramProtocol):
             dmrd = dmrd[:15] + bytes([bits]) + dmrd[16:]
 
         source = ('openbridge', obp_name)
-        now = time()
-        frame_type = (bits & 0x30) >> 4
-        is_term = self._is_dmr_terminator(dmrd, frame_type)
+        now = self._now
+        _, _, frame_type, _, is_term = _BITS_DECODE[bits]
 
         stream = state.streams.get(stream_id)
         if stream is None:
@@ -4112,7 +4081,7 @@ class HBProtocol(asyncio.DatagramProtocol):
             state.streams[stream_id] = stream
             LOGGER.info(f'[OBP {obp_name}] RX stream start src={int.from_bytes(rf_src, "big")} '
                         f'tgid={int.from_bytes(dst_id, "big")} -> TS{local_ts} '
-                        f'stream_id={stream_id.hex()} targets={len(targets)}')
+                        f'stream_id={stream.stream_id_hex} targets={len(targets)}')
             self._emit_stream_start('openbridge', obp_name, local_ts, rf_src, dst_id,
                                     stream_id, 'group',
                                     remote_repeater_id=int.from_bytes(peer_id, 'big'))
@@ -4127,7 +4096,7 @@ class HBProtocol(asyncio.DatagramProtocol):
         if is_term and not stream.ended:
             stream.ended = True
             stream.end_time = now
-            LOGGER.info(f'[OBP {obp_name}] RX stream end stream_id={stream_id.hex()} '
+            LOGGER.info(f'[OBP {obp_name}] RX stream end stream_id={stream.stream_id_hex} '
                         f'packets={stream.packet_count}')
             self._emit_stream_end('openbridge', obp_name, local_ts, stream, 'terminator')
 
@@ -4153,13 +4122,13 @@ class HBProtocol(asyncio.DatagramProtocol):
 
     def _send_packet(self, data: bytes, addr: tuple):
         """Send packet to specified address"""
-        cmd = data[:4]
-        #if cmd != DMRD:  # Don't log DMR data packets
-        #    LOGGER.debug(f'Sending {cmd.decode()} to {addr[0]}:{addr[1]}')
+        #if data[:4] != DMRD and LOGGER.isEnabledFor(logging.DEBUG):  # Don't log DMR data packets
+        #    LOGGER.debug('Sending %s to %s:%s', data[:4].decode(), addr[0], addr[1])
         # asyncio uses sendto() instead of write(data, addr)
-        self.transport.sendto(data, normalize_addr(addr))
+        self._sendto(data, normalize_addr(addr))
 
-    def _send_nak(self, repeater_id: bytes, addr: tuple, reason: str = None, is_shutdown: bool = False):
+    def _send_nak(self, repeater_id: bytes, addr: tuple, reason: str = None, is_shutdown: bool = False,
+                  repeater: Optional[RepeaterState] = None):
         """Send NAK to specified address
         
         Args:
@@ -4167,14 +4136,13 @@ class HBProtocol(asyncio.DatagramProtocol):
             addr: The address to send the NAK to
             reason: Why the NAK is being sent
             is_shutdown: Whether this NAK is part of a graceful shutdown
+            repeater: The repeater's state, if known (reuses its prebuilt NAK packet)
         """
-        log_level = logging.DEBUG if is_shutdown else logging.WARNING
-        log_msg = f'Sending NAK to {addr[0]}:{addr[1]} for repeater {rid_to_int(repeater_id)}'
-        if reason:
-            log_msg += f' - {reason}'
-        
-        LOGGER.log(log_level, log_msg)
-        self._send_packet(b''.join([MSTNAK, repeater_id]), addr)
+        LOGGER.log(logging.DEBUG if is_shutdown else logging.WARNING,
+                   'Sending NAK to %s:%s for repeater %d%s',
+                   addr[0], addr[1], rid_to_int(repeater_id),
+                   f' - {reason}' if reason else '')
+        self._send_packet(repeater.nak_packet if repeater is not None else MSTNAK + repeater_id, addr)
 
 
 # Logging functions moved to utils.py
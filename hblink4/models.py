@@ -20,17 +20,19 @@ import asyncio
 from dataclasses import dataclass, field
 from time import time
 from random import randint
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
 # Import utils functions that these models depend on
 try:
-    from .utils import safe_decode_bytes, PeerAddress
+    from .utils import safe_decode_bytes, PeerAddress, DATACLASS_SLOTS
+    from .constants import MSTPONG, MSTNAK, RPTACK
 except ImportError:
     # Fallback for when called from outside package
     import sys
     import os
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from utils import safe_decode_bytes, PeerAddress
+    from utils import safe_decode_bytes, PeerAddress, DATACLASS_SLOTS
+    from constants import MSTPONG, MSTNAK, RPTACK
 
 
 @dataclass
@@ -119,7 +121,7 @@ class OpenBridgeConnectionConfig:
             raise ValueError(f"OpenBridge connection '{self.name}' has invalid network_id: {self.network_id}")
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StreamState:
     """Tracks an active DMR transmission stream"""
     repeater_id: bytes          # Repeater this stream is on
@@ -164,19 +166,31 @@ class StreamState:
     lc_base: Optional[bytes] = None
     lc_cache: Dict[Tuple[bytes, bytes], Any] = field(default_factory=dict)
 
-    def is_active(self, timeout: float = 2.0) -> bool:
-        """Check if stream is still active (within timeout period)"""
-        return (time() - self.last_seen) < timeout
+    # Integer forms of rf_src/dst_id for logging and events (computed once)
+    rf_src_int: int = field(default=0, init=False, repr=False)
+    dst_id_int: int = field(default=0, init=False, repr=False)
+    # Hex form of stream_id for logs and events (computed once)
+    stream_id_hex: str = field(default='', init=False, repr=False)
+
+    def __post_init__(self):
+        """Cache integer forms of the stream addressing and the hex stream ID"""
+        self.rf_src_int = int.from_bytes(self.rf_src, 'big')
+        self.dst_id_int = int.from_bytes(self.dst_id, 'big')
+        self.stream_id_hex = self.stream_id.hex()
+
+    def is_active(self, now: float, timeout: float = 2.0) -> bool:
+        """Check if stream is still active (within timeout period) as of `now`"""
+        return (now - self.last_seen) < timeout
     
-    def is_in_hang_time(self, timeout: float, hang_time: float) -> bool:
-        """Check if stream is in hang time (ended but slot reserved for same source)"""
+    def is_in_hang_time(self, now: float, timeout: float, hang_time: float) -> bool:
+        """Check if stream is in hang time (ended but slot reserved for same source) as of `now`"""
         if not self.ended or not self.end_time:
             return False
-        time_since_end = time() - self.end_time
+        time_since_end = now - self.end_time
         return time_since_end < hang_time
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class OutboundState:
     """Data class for tracking outbound server connection state"""
     config: OutboundConnectionConfig  # Configuration object
@@ -202,8 +216,8 @@ class OutboundState:
     
     # TDMA slot tracking - we're acting as a repeater with 2 timeslots
     # Each slot can only carry ONE talkgroup stream at a time (air interface constraint)
-    slot1_stream: Optional['StreamState'] = None
-    slot2_stream: Optional['StreamState'] = None
+    # Indexed by slot - 1: [slot 1 stream, slot 2 stream]
+    streams: List[Optional['StreamState']] = field(default_factory=lambda: [None, None])
     
     @property
     def sockaddr(self) -> Tuple[str, int]:
@@ -226,18 +240,12 @@ class OutboundState:
     
     def get_slot_stream(self, slot: int) -> Optional['StreamState']:
         """Get the active stream for a given slot (TDMA timeslot)"""
-        if slot == 1:
-            return self.slot1_stream
-        elif slot == 2:
-            return self.slot2_stream
-        return None
+        return self.streams[slot - 1] if 1 <= slot <= 2 else None
     
     def set_slot_stream(self, slot: int, stream: Optional['StreamState']) -> None:
         """Set the active stream for a given slot (TDMA timeslot)"""
-        if slot == 1:
-            self.slot1_stream = stream
-        elif slot == 2:
-            self.slot2_stream = stream
+        if 1 <= slot <= 2:
+            self.streams[slot - 1] = stream
 
 
 @dataclass
@@ -282,7 +290,7 @@ class OpenBridgeState:
         return self.config.talkgroup_slots.get(dst_id)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RepeaterState:
     """
     Data class for storing inbound connection state.
@@ -332,6 +340,11 @@ class RepeaterState:
 
     rpto_received: bool = False  # True if repeater sent RPTO to override config TGs
 
+    # Matched access_control.RepeaterConfig, resolved once when the repeater
+    # sends RPTC (callsign known) and reused by later lookups such as RPTO.
+    # A reconnect builds a fresh RepeaterState, so this never goes stale.
+    repeater_config: Optional[Any] = field(default=None, repr=False)
+
     # Whether this repeater participates in unit (private) call routing. Seeded
     # from the matched pattern's `default_unit_calls` when the repeater connects,
     # and overridden by a `UNIT=true|false` entry in RPTO if present.
@@ -357,16 +370,34 @@ class RepeaterState:
     # from a single radio ID. None = no rewrite (default).
     tx_src_override: Optional[bytes] = None
     
-    # Active stream tracking per slot
-    slot1_stream: Optional[StreamState] = None
-    slot2_stream: Optional[StreamState] = None
+    # Active stream tracking per slot, indexed by slot - 1
+    streams: List[Optional[StreamState]] = field(default_factory=lambda: [None, None])
     
+    # Integer repeater ID for logging and events (computed once)
+    repeater_id_int: int = field(default=0, init=False, repr=False)
+
+    # Salt as sent in the RPTL challenge and hashed in RPTK (computed once)
+    salt_bytes: bytes = field(default=b'', init=False, repr=False)
+
+    # Replies that only depend on repeater_id, built once per connection
+    pong_packet: bytes = field(default=b'', init=False, repr=False)  # MSTPONG + repeater_id
+    ack_packet: bytes = field(default=b'', init=False, repr=False)   # RPTACK + repeater_id
+    nak_packet: bytes = field(default=b'', init=False, repr=False)   # MSTNAK + repeater_id
+
     # Cached decoded strings (for efficiency - decode once, use many times)
     _callsign_str: str = field(default='', init=False, repr=False)
     _location_str: str = field(default='', init=False, repr=False)
     _rx_freq_str: str = field(default='', init=False, repr=False)
     _tx_freq_str: str = field(default='', init=False, repr=False)
     _colorcode_str: str = field(default='', init=False, repr=False)
+
+    def __post_init__(self):
+        """Cache the integer repeater ID, salt bytes and the fixed reply packets"""
+        self.repeater_id_int = int.from_bytes(self.repeater_id, 'big')
+        self.salt_bytes = self.salt.to_bytes(4, 'big')
+        self.pong_packet = MSTPONG + self.repeater_id
+        self.ack_packet = RPTACK + self.repeater_id
+        self.nak_packet = MSTNAK + self.repeater_id
     
     @property
     def sockaddr(self) -> PeerAddress:
@@ -405,15 +436,9 @@ class RepeaterState:
     
     def get_slot_stream(self, slot: int) -> Optional[StreamState]:
         """Get the active stream for a given slot"""
-        if slot == 1:
-            return self.slot1_stream
-        elif slot == 2:
-            return self.slot2_stream
-        return None
+        return self.streams[slot - 1] if 1 <= slot <= 2 else None
     
     def set_slot_stream(self, slot: int, stream: Optional[StreamState]) -> None:
         """Set the active stream for a given slot"""
-        if slot == 1:
-            self.slot1_stream = stream
-        elif slot == 2:
-            self.slot2_stream = stream
\ No newline at end of file
+        if 1 <= slot <= 2:
+            self.streams[slot - 1] = stream
\ No newline at end of file
@@ -5,14 +5,27 @@ This module contains standalone utility functions that don't depend on
 application state or class instances. These are pure functions that 
 can be used throughout the codebase.
 """
+import atexit
 import logging
 import logging.handlers
+import os
 import pathlib
+import queue
+import re
+import sys
 from typing import Tuple, Union
 
 # Type definitions for reusability
 PeerAddress = Union[Tuple[str, int], Tuple[str, int, int, int]]
 
+# Keyword arguments for @dataclass(**DATACLASS_SLOTS): slotted instances on
+# Python 3.10+ (no per-instance __dict__, faster attribute access), plain
+# dataclasses on older interpreters
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Date suffix of rotated log files (hblink.log.YYYY-MM-DD)
+_LOG_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
 
 def safe_decode_bytes(data: bytes) -> str:
     """
@@ -204,19 +217,27 @@ def cleanup_old_logs(log_dir: pathlib.Path, max_days: int, logger: logging.Logge
     cutoff_date = current_date - timedelta(days=max_days)
     
     try:
-        for log_file in log_dir.glob('hblink.log.*'):
-            try:
-                # Extract date from filename (expecting format: hblink.log.YYYY-MM-DD)
-                date_str = log_file.name.split('.')[-1]
-                file_date = datetime.strptime(date_str, '%Y-%m-%d')
-                
-                if file_date < cutoff_date:
-                    log_file.unlink()
+        with os.scandir(log_dir) as entries:
+            for entry in entries:
+                if not entry.name.startswith('hblink.log.'):
+                    continue
+                try:
+                    # Extract date from filename (expecting format: hblink.log.YYYY-MM-DD)
+                    date_str = entry.name.split('.')[-1]
+                    match = _LOG_DATE_RE.fullmatch(date_str)
+                    if not match:
+                        raise ValueError(f"suffix '{date_str}' is not a YYYY-MM-DD date")
+                    file_date = datetime(*map(int, match.groups()))
+                    
+                    if file_date < cutoff_date:
+                        os.unlink(entry.path)
+                        if logger:
+                            logger.debug(f'Deleted old log file from {date_str}: {entry.path}')
+                except (OSError, ValueError) as e:
                     if logger:
-                        logger.debug(f'Deleted old log file from {date_str}: {log_file}')
-            except (OSError, ValueError) as e:
-                if logger:
-                    logger.warning(f'Error processing old log file {log_file}: {e}')
+                        logger.warning(f'Error processing old log file {entry.path}: {e}')
+    except FileNotFoundError:
+        pass  # No log directory yet, nothing to clean up
     except Exception as e:
         if logger:
             logger.error(f'Error during log cleanup: {e}')
@@ -261,10 +282,9 @@ def setup_logging(config: dict, logger_name: str = __name__) -> logging.Logger:
         interval=1,
         backupCount=max_days
     )
-    # Set the suffix for rotated files to YYYY-MM-DD
+    # Rotated files are named hblink.log.YYYY-MM-DD (the suffix is used as-is,
+    # so no namer is needed)
     file_handler.suffix = '%Y-%m-%d'
-    # Don't include seconds in date suffix
-    file_handler.namer = lambda name: name.replace('.%Y-%m-%d%H%M%S', '.%Y-%m-%d')
     
     file_handler.setLevel(file_level)
     file_handler.setFormatter(log_format)
@@ -274,9 +294,16 @@ def setup_logging(config: dict, logger_name: str = __name__) -> logging.Logger:
     console_handler.setLevel(console_level)
     console_handler.setFormatter(log_format)
     
-    # Add handlers if not already present
+    # Add handlers if not already present. The logger itself only gets a
+    # QueueHandler; file and console writes happen on the listener's thread
+    # so a slow disk or terminal never stalls the event loop.
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        atexit.register(listener.stop)  # Drain queued records before exit
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     return logger
\ No newline at end of file
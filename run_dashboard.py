@@ -7,6 +7,8 @@ Starts the FastAPI web dashboard server
 import sys
 import uvicorn
 
+from dashboard.server import select_event_loop
+
 if __name__ == '__main__':
     # Default host and port
     host = '0.0.0.0'  # Listen on all interfaces
@@ -28,5 +30,7 @@ if __name__ == '__main__':
         port=port,
         log_level="info",
         access_log=False,  # Disable access logging to reduce log clutter
-        loop="asyncio"  # Disable uvloop - it breaks Unix socket connections
+        loop=select_event_loop(),  # uvloop for TCP events only - it breaks Unix socket connections
+        http="auto",
+        ws="websockets"
     )
@@ -224,6 +224,26 @@ class TestRepeaterMatcher(unittest.TestCase):
         self.assertEqual(config.slot1_talkgroups, [8])
         self.assertEqual(config.slot2_talkgroups, [31201, 31202])
 
+    def test_overlapping_id_ranges(self):
+        """Test that overlapping, adjacent and unsorted ranges in one pattern all match"""
+        logging.info("\n=== Testing Overlapping ID Ranges ===")
+        matcher = RepeaterMatcher({
+            "repeaters": {
+                "patterns": [
+                    {
+                        "name": "Merged Ranges",
+                        "match": {"id_ranges": [[500, 600], [100, 200], [150, 300], [301, 310]]},
+                        "config": {"passphrase": "merged-key"}
+                    }
+                ],
+                "default": self.config["repeaters"]["default"]
+            }
+        })
+        for radio_id in (100, 250, 300, 305, 310, 500, 600):
+            self.assertEqual(matcher.get_repeater_config(radio_id).passphrase, "merged-key")
+        for radio_id in (99, 311, 499, 601):
+            self.assertEqual(matcher.get_repeater_config(radio_id).passphrase, "passw0rd")
+
     def test_default_config(self):
         """Test falling back to default configuration"""
         logging.info("\n=== Testing Default Configuration Fallback ===")
@@ -316,5 +336,20 @@ class TestRepeaterMatcher(unittest.TestCase):
         self.assertEqual(context.exception.pattern_name, "Blocked Callsigns")
         self.assertEqual(context.exception.reason, "Network abuse")
 
+    def test_lookup_cache(self):
+        """Test that memoized lookups return the same results and can be invalidated"""
+        first = self.matcher.get_repeater_config(999999, "WA0EDA-1")
+        self.assertIs(self.matcher.get_repeater_config(999999, "WA0EDA-1"), first)
+        self.assertIn((999999, "WA0EDA-1"), self.matcher._lookup_cache)
+
+        # Cached blacklist hits must keep raising
+        for _ in range(2):
+            with self.assertRaises(BlacklistError):
+                self.matcher.get_repeater_config(1, "TEST")
+
+        self.matcher.invalidate_cache()
+        self.assertEqual(self.matcher._lookup_cache, {})
+        self.assertIs(self.matcher.get_repeater_config(999999, "WA0EDA-1"), first)
+
 if __name__ == '__main__':
     unittest.main()
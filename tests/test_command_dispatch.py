@@ -0,0 +1,93 @@
+"""
+Tests for inbound command dispatch in HBProtocol.datagram_received: each
+command reaches its handler with the right repeater_id slice and payload
+offset, RPTCL is split out of the RPTC prefix, and datagrams too short to
+hold a repeater ID take the unknown-packet path
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from unittest.mock import Mock
+
+import pytest
+
+from hblink4.hblink import HBProtocol
+
+RID = (312100).to_bytes(4, 'big')
+ADDR = ('127.0.0.1', 62031)
+HANDLERS = ('_handle_dmr_data', '_handle_repeater_login', '_handle_auth_response',
+            '_handle_config', '_handle_disconnect', '_handle_ping', '_handle_options',
+            '_handle_talker_alias')
+
+
+@pytest.fixture
+def protocol():
+    """HBProtocol with a connected repeater and every handler recorded"""
+    p = HBProtocol.__new__(HBProtocol)
+    p._events = Mock()
+    p._repeaters = {RID: Mock(connection_state='connected', missed_pings=0)}
+    p.calls = []
+    for name in HANDLERS:
+        setattr(p, name, lambda rid, payload, addr, name=name: p.calls.append((name, rid, payload)))
+    p.naks = []
+    p._send_nak = lambda rid, addr, **kw: p.naks.append(rid)
+    return p
+
+
+def test_rptc_reaches_config_handler(protocol):
+    packet = b'RPTC' + RID + b'CALLSIGN' + bytes(20)
+    protocol.datagram_received(packet, ADDR)
+    assert protocol.calls == [('_handle_config', RID, packet)]
+
+
+def test_rptcl_reaches_disconnect_handler(protocol):
+    packet = b'RPTCL' + RID
+    protocol.datagram_received(packet, ADDR)
+    assert protocol.calls == [('_handle_disconnect', RID, packet)]
+
+
+@pytest.mark.parametrize('prefix, handler, offset', [
+    (b'RPTL', '_handle_repeater_login', 0),
+    (b'RPTK', '_handle_auth_response', 8),
+    (b'RPTO', '_handle_options', 8),
+    (b'DMRA', '_handle_talker_alias', 8),
+])
+def test_id_at_offset_4_commands(protocol, prefix, handler, offset):
+    packet = prefix + RID + b'payload'
+    protocol.datagram_received(packet, ADDR)
+    assert protocol.calls == [(handler, RID, packet[offset:])]
+
+
+def test_rptping_reaches_ping_handler(protocol):
+    packet = b'RPTPING' + RID
+    protocol.datagram_received(packet, ADDR)
+    assert protocol.calls == [('_handle_ping', RID, packet)]
+
+
+def test_dmrd_reaches_dmr_data_handler(protocol):
+    packet = b'DMRD' + bytes(7) + RID + bytes(40)
+    protocol.datagram_received(packet, ADDR)
+    assert protocol.calls == [('_handle_dmr_data', RID, packet)]
+
+
+def test_unregistered_repeater_gets_nak(protocol):
+    other = (312101).to_bytes(4, 'big')
+    protocol.datagram_received(b'RPTC' + other, ADDR)
+    assert protocol.calls == []
+    assert protocol.naks == [other]
+
+
+@pytest.mark.parametrize('packet', [
+    b'RPTC',                 # no ID at all
+    b'RPTL' + RID[:2],       # partial ID
+    b'RPTCL' + RID[:3],
+    b'RPTPING' + RID[:1],
+    b'DMRD' + bytes(9),
+    b'XXXX' + RID,           # unknown command
+])
+def test_short_or_unknown_packet_takes_unknown_path(protocol, packet, caplog):
+    protocol.datagram_received(packet, ADDR)
+    assert protocol.calls == []
+    assert protocol.naks == []
+    assert 'UNKNOWN PACKET TYPE' in caplog.text
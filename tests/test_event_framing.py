@@ -0,0 +1,96 @@
+"""
+Tests for the hblink4 <-> dashboard event socket framing: dashboard's
+encode_frame/split_frames and EventEmitter._take_frames, in both 'length'
+(4-byte big-endian prefix) and 'jsonl' (newline-delimited) modes
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+pytest.importorskip('fastapi')
+
+from dashboard.server import encode_frame, split_frames
+from hblink4.events import EventEmitter
+
+FRAMINGS = ('length', 'jsonl')
+
+PAYLOADS = [
+    b'{"type":"stream_start","timestamp":1.5,"data":{"repeater_id":312100}}',
+    b'{"type":"repeater_keepalive","timestamp":2.0,"data":{}}',
+    b'{"type":"sync_request"}',
+]
+
+
+def _split_all(chunks, framing):
+    """Feed chunks through split_frames the way the dashboard's reader does"""
+    frames, buffer = [], b''
+    for chunk in chunks:
+        new_frames, buffer = split_frames(buffer + chunk, framing)
+        frames.extend(new_frames)
+    return frames, buffer
+
+
+def _take_all(chunks, framing):
+    """Feed chunks through EventEmitter._take_frames the way its reader does"""
+    emitter = EventEmitter(enabled=False, framing=framing)
+    frames = []
+    for chunk in chunks:
+        emitter.recv_buffer += chunk
+        frames.extend(emitter._take_frames())
+    return frames, emitter.recv_buffer
+
+
+@pytest.mark.parametrize('reader', [_split_all, _take_all])
+@pytest.mark.parametrize('framing', FRAMINGS)
+def test_several_frames_in_one_read(reader, framing):
+    stream = b''.join(encode_frame(p, framing) for p in PAYLOADS)
+    frames, leftover = reader([stream], framing)
+    assert frames == PAYLOADS
+    assert leftover == b''
+
+
+@pytest.mark.parametrize('reader', [_split_all, _take_all])
+@pytest.mark.parametrize('framing', FRAMINGS)
+def test_partial_frame_is_held_until_complete(reader, framing):
+    frame = encode_frame(PAYLOADS[0], framing)
+    frames, leftover = reader([frame[:-5]], framing)
+    assert frames == []
+    assert leftover == frame[:-5]
+
+    frames, leftover = reader([frame[:-5], frame[-5:]], framing)
+    assert frames == [PAYLOADS[0]]
+    assert leftover == b''
+
+
+@pytest.mark.parametrize('reader', [_split_all, _take_all])
+def test_length_prefix_split_across_reads(reader):
+    frame = encode_frame(PAYLOADS[1], 'length')
+    frames, leftover = reader([frame[:2]], 'length')
+    assert frames == []
+    assert leftover == frame[:2]
+
+    frames, leftover = reader([frame[:2], frame[2:]], 'length')
+    assert frames == [PAYLOADS[1]]
+    assert leftover == b''
+
+
+@pytest.mark.parametrize('reader', [_split_all, _take_all])
+def test_trailing_partial_jsonl_line(reader):
+    stream = encode_frame(PAYLOADS[0], 'jsonl') + PAYLOADS[1][:10]
+    frames, leftover = reader([stream], 'jsonl')
+    assert frames == [PAYLOADS[0]]
+    assert leftover == PAYLOADS[1][:10]
+
+
+@pytest.mark.parametrize('reader', [_split_all, _take_all])
+@pytest.mark.parametrize('framing', FRAMINGS)
+def test_round_trip_at_every_read_size(reader, framing):
+    """Every way of chopping the byte stream yields the same frames"""
+    stream = b''.join(encode_frame(p, framing) for p in PAYLOADS)
+    for size in range(1, len(stream) + 1):
+        chunks = [stream[i:i + size] for i in range(0, len(stream), size)]
+        frames, leftover = reader(chunks, framing)
+        assert frames == PAYLOADS, f"read size {size}"
+        assert leftover == b''
@@ -28,27 +28,27 @@ def test_hang_time():
     )
     
     # Test 1: Active stream, not ended
-    assert stream.is_active(2.0), "Stream should be active"
-    assert not stream.is_in_hang_time(2.0, 3.0), "Active stream should not be in hang time"
+    assert stream.is_active(time(), 2.0), "Stream should be active"
+    assert not stream.is_in_hang_time(time(), 2.0, 3.0), "Active stream should not be in hang time"
     print("✓ Active stream is not in hang time")
     
     # Wait for stream to timeout
     sleep(2.1)
     
     # Test 2: Stream timed out but not marked as ended
-    assert not stream.is_active(2.0), "Stream should be inactive after timeout"
-    assert not stream.is_in_hang_time(2.0, 3.0), "Unmarked stream should not be in hang time"
+    assert not stream.is_active(time(), 2.0), "Stream should be inactive after timeout"
+    assert not stream.is_in_hang_time(time(), 2.0, 3.0), "Unmarked stream should not be in hang time"
     print("✓ Timed out stream (not marked ended) is not in hang time")
     
     # Test 3: Mark stream as ended - now it should be in hang time
     stream.ended = True
     stream.end_time = time()  # For hang time calculation
-    assert stream.is_in_hang_time(2.0, 3.0), "Ended stream should be in hang time"
+    assert stream.is_in_hang_time(time(), 2.0, 3.0), "Ended stream should be in hang time"
     print("✓ Ended stream is in hang time")
     
     # Test 4: Wait for hang time to expire
     sleep(3.1)  # Total: 5.2s (2.1s timeout + 3.1s hang time)
-    assert not stream.is_in_hang_time(2.0, 3.0), "Stream should be out of hang time"
+    assert not stream.is_in_hang_time(time(), 2.0, 3.0), "Stream should be out of hang time"
     print("✓ Stream exits hang time after configured duration")
     
     # Test 5: Create new stream to test hang time during active transmission
@@ -65,7 +65,7 @@ def test_hang_time():
     )
     
     # Active stream should never be in hang time
-    assert not stream2.is_in_hang_time(2.0, 3.0), "Active stream cannot be in hang time"
+    assert not stream2.is_in_hang_time(time(), 2.0, 3.0), "Active stream cannot be in hang time"
     print("✓ New active stream is not in hang time")
     
     print("Stream hang time tests passed!\n")
@@ -90,27 +90,27 @@ def test_hang_time_edge_cases():
         end_time=current  # For hang time calculation
     )
     
-    assert stream.is_in_hang_time(2.0, 3.0), "Should be in hang time at boundary"
+    assert stream.is_in_hang_time(current, 2.0, 3.0), "Should be in hang time at boundary"
     print("✓ Hang time starts exactly at timeout boundary")
     
     # Test 2: Stream at exactly hang time expiry
     stream.last_seen = current - 5.0  # 2.0s timeout + 3.0s hang = 5.0s total
     stream.end_time = current - 3.0  # Ended 3s ago (exactly at hang time expiry)
-    assert not stream.is_in_hang_time(2.0, 3.0), "Should be out of hang time at expiry"
+    assert not stream.is_in_hang_time(current, 2.0, 3.0), "Should be out of hang time at expiry"
     print("✓ Hang time ends exactly at expiry boundary")
     
     # Test 3: Different timeout and hang time values
     stream.last_seen = current - 3.5
     stream.ended = True
     stream.end_time = current - 0.5  # Ended 0.5s ago, within 2.0s hang time
-    assert stream.is_in_hang_time(3.0, 2.0), "Should work with different timeout/hang values"
+    assert stream.is_in_hang_time(current, 3.0, 2.0), "Should work with different timeout/hang values"
     print("✓ Hang time works with custom timeout values")
     
     # Test 4: Zero hang time
     stream.last_seen = current - 2.1
     stream.ended = True
     stream.end_time = current - 0.1  # Ended 0.1s ago, but 0.0s hang time
-    assert not stream.is_in_hang_time(2.0, 0.0), "Zero hang time should immediately expire"
+    assert not stream.is_in_hang_time(current, 2.0, 0.0), "Zero hang time should immediately expire"
     print("✓ Zero hang time expires immediately")
     
     print("Hang time edge case tests passed!\n")
@@ -383,7 +383,7 @@ def test_slot_availability_exclusion():
         last_seen=time(),
         stream_id=b'\xaa\xaa\xaa\xaa'
     )
-    repeater.slot1_stream = active_stream
+    repeater.set_slot_stream(1, active_stream)
     
     # New stream wants to use TS1 on this repeater
     # Should be excluded because slot is busy
@@ -432,7 +432,7 @@ def test_assumed_stream_route_cache_removal():
         target_repeaters={b'\x02'},  # Will TX to repeater B
         routing_cached=True
     )
-    repeater_a.slot1_stream = stream_a
+    repeater_a.set_slot_stream(1, stream_a)
     
     # Repeater B has an assumed stream (we're TX'ing to it)
     assumed_stream = StreamState(
@@ -445,11 +445,11 @@ def test_assumed_stream_route_cache_removal():
         stream_id=b'\xaa\xaa\xaa\xaa',
         is_assumed=True  # This is the key flag
     )
-    repeater_b.slot1_stream = assumed_stream
+    repeater_b.set_slot_stream(1, assumed_stream)
     
     # Verify initial state
     assert b'\x02' in stream_a.target_repeaters, "Repeater B should be in route-cache"
-    assert repeater_b.slot1_stream.is_assumed, "Repeater B should have assumed stream"
+    assert repeater_b.get_slot_stream(1).is_assumed, "Repeater B should have assumed stream"
     print("✓ Initial state: Repeater B in route-cache, has assumed TX stream")
     
     # Now simulate: Repeater B starts receiving a new stream
@@ -479,10 +479,10 @@ def test_assumed_stream_route_cache_removal():
         stream_id=b'\xbb\xbb\xbb\xbb',
         is_assumed=False  # Real RX stream
     )
-    repeater_b.slot1_stream = new_real_stream
+    repeater_b.set_slot_stream(1, new_real_stream)
     
-    assert not repeater_b.slot1_stream.is_assumed, "Repeater B should have real stream now"
-    assert repeater_b.slot1_stream.stream_id == b'\xbb\xbb\xbb\xbb', "Should be new stream"
+    assert not repeater_b.get_slot_stream(1).is_assumed, "Repeater B should have real stream now"
+    assert repeater_b.get_slot_stream(1).stream_id == b'\xbb\xbb\xbb\xbb', "Should be new stream"
     print("✓ Real RX stream replaces assumed TX stream")
     
     # The key benefit: We stop wasting bandwidth sending to B
@@ -27,17 +27,17 @@ def test_stream_state():
     )
     
     # Test active stream
-    assert stream.is_active(2.0), "Stream should be active immediately"
+    assert stream.is_active(time(), 2.0), "Stream should be active immediately"
     print("✓ Stream is active immediately after creation")
     
     # Wait and test still active
     sleep(0.5)
-    assert stream.is_active(2.0), "Stream should still be active after 0.5s"
+    assert stream.is_active(time(), 2.0), "Stream should still be active after 0.5s"
     print("✓ Stream is active after 0.5s")
     
     # Test inactive after timeout
     sleep(2.0)
-    assert not stream.is_active(2.0), "Stream should be inactive after 2.5s total"
+    assert not stream.is_active(time(), 2.0), "Stream should be inactive after 2.5s total"
     print("✓ Stream is inactive after timeout")
     
     print("StreamState tests passed!\n")
@@ -2,7 +2,8 @@
 Tests for DMR terminator frame detection using Homebrew Protocol (HBP) flags
 """
 import pytest
-from hblink4.hblink import HBProtocol
+from hblink4.hblink import HBProtocol, _BITS_DECODE
+from hblink4.protocol import parse_dmr_packet, is_dmr_terminator
 
 
 def test_voice_terminator_detection():
@@ -120,5 +121,24 @@ def test_wrong_dtype_vseq():
     assert result is False, "DATA_SYNC with wrong dtype_vseq should not be terminator"
 
 
+def test_bits_decode_table_matches_protocol():
+    """The precomputed byte-15 table used on the per-packet paths must agree
+    with parse_dmr_packet's bit decode and is_dmr_terminator for every value"""
+    assert len(_BITS_DECODE) == 256
+    for bits in range(256):
+        packet = bytearray(55)
+        packet[0:4] = b'DMRD'
+        packet[15] = bits
+        parsed = parse_dmr_packet(bytes(packet))
+        expected = (
+            parsed['slot'],
+            parsed['call_type'],
+            parsed['frame_type'],
+            bits & 0x0F,  # dtype_vseq
+            is_dmr_terminator(bytes(packet), parsed['frame_type']),
+        )
+        assert _BITS_DECODE[bits] == expected, f"bits=0x{bits:02X}"
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])